@@ -0,0 +1,11 @@
+
+"""
+Internal. Compatibility helpers for older Python versions.
+"""
+
+import sys
+import typing as t
+
+#: Keyword arguments for #dataclasses.dataclass() that add `__slots__` to the generated class. Only supported
+#: since Python 3.10; on older versions the classes keep their `__dict__`.
+DATACLASS_SLOTS: t.Dict[str, t.Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,47 @@
+
+"""
+Internal. JSON helpers that use [orjson](https://github.com/ijl/orjson) if it is installed and fall back to
+[msgspec](https://jcristharif.com/msgspec/) for encoding, or the standard library #json module otherwise.
+"""
+
+import json
+import typing as t
+
+try:
+  import orjson
+  _HAS_ORJSON = True
+except ImportError:
+  _HAS_ORJSON = False
+
+try:
+  import msgspec
+  # A single encoder instance reuses its internal output buffer across calls.
+  _MSGSPEC_ENCODER: t.Optional['msgspec.json.Encoder'] = msgspec.json.Encoder()
+except ImportError:
+  _MSGSPEC_ENCODER = None
+
+#: Raised by #loads() for malformed input. `orjson.JSONDecodeError` is a subclass of this exception.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: t.Union[bytes, str]) -> t.Any:
+  """
+  Decode JSON from *data*. Passing `bytes` avoids decoding the input to a string first.
+  """
+
+  if _HAS_ORJSON:
+    return orjson.loads(data)
+  return json.loads(data)
+
+
+def dumps(obj: t.Any, indent: t.Optional[int] = None) -> bytes:
+  """
+  Encode *obj* to UTF-8 encoded JSON. orjson only supports an *indent* of 2, any other indentation is
+  handled by the standard library.
+  """
+
+  if _HAS_ORJSON and indent in (None, 2):
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+  if _MSGSPEC_ENCODER is not None and indent is None:
+    return _MSGSPEC_ENCODER.encode(obj)
+  return json.dumps(obj, indent=indent).encode('utf-8')
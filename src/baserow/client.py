@@ -1,19 +1,72 @@
 
+import asyncio
 import dataclasses
-import json
+import http.cookiejar
+import importlib.util
+import itertools
 import logging
+import os
+import tempfile
+import threading
 import typing as t
 from pathlib import Path
 
 import databind.json
 import requests
-
-from .filter import Filter, FilterType
+from databind.core.settings import ExtraKeys
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+  import httpx
+  _HAS_HTTPX = True
+except ImportError:
+  _HAS_HTTPX = False
+
+try:
+  import msgspec
+  _HAS_MSGSPEC = True
+except ImportError:
+  _HAS_MSGSPEC = False
+
+try:
+  import simdjson
+  _HAS_SIMDJSON = True
+except ImportError:
+  _HAS_SIMDJSON = False
+
+from . import _json
+from .field_types import load_table_field
+from .filter import Filter, FilterType, to_query_parameters
 from .types import Application, Page, PermissionedOrderedGroup, Table, TableField, User
 
 log = logging.getLogger(__name__)
 DEFAULT_CREDENTIALS_FILE = '.baserow-creds.json'
 
+#: The maximum number of rows that Baserow accepts in a single batch request.
+BATCH_SIZE = 200
+
+#: The chunk size to read large response bodies with. `requests` uses 10 KiB chunks to fill
+#: `Response.content`, which means thousands of reads and intermediate bytes objects for a large page of rows.
+_READ_CHUNK_SIZE = 1024 * 1024
+
+@ExtraKeys()
+@dataclasses.dataclass
+class _UserResponse:
+  """
+  Internal. The response of the endpoints that authenticate or create a user.
+  """
+
+  user: User
+  token: t.Optional[str] = None
+
+
+#: Response types that msgspec can decode from JSON directly into the dataclasses in #baserow.types. Types
+#: that contain enums (which Baserow encodes by name) or the #TableField union are always loaded with databind.
+#: msgspec ignores unknown keys, so these types are marked with `@ExtraKeys()` for databind to do the same.
+_MSGSPEC_TYPES: t.Tuple[t.Any, ...] = (User, _UserResponse, Table, t.List[Table], Application, t.List[Application])
+_MSGSPEC_DECODERS: t.Dict[t.Any, t.Any] = {x: msgspec.json.Decoder(x) for x in _MSGSPEC_TYPES} if _HAS_MSGSPEC else {}
+
 
 @dataclasses.dataclass
 class ApiError(Exception):
@@ -24,6 +77,71 @@ class ApiError(Exception):
     return f'{self.error}: {self.detail}'
 
 
+@dataclasses.dataclass
+class BatchError(Exception):
+  """
+  Raised by the batch methods of #BaserowClient if a chunk fails after the preceding chunks were applied.
+  """
+
+  #: The rows returned for the chunks that were applied before the error.
+  results: t.List[t.Dict[str, t.Any]]
+
+  #: The error of the failed chunk.
+  error: Exception
+
+  def __str__(self) -> str:
+    return f'batch request failed after {len(self.results)} rows: {self.error}'
+
+
+#: Parsed credential files, keyed by their absolute path, together with the #_file_version() they were read at.
+_CREDENTIALS_CACHE: t.Dict[Path, t.Tuple[t.Tuple[int, int, int], t.Dict[str, t.Any]]] = {}
+
+
+def _file_version(path: Path) -> t.Tuple[int, int, int]:
+  """
+  Internal. Returns the modification time, size and inode of *path*. The modification time alone may not change
+  if the file is rewritten within the timestamp resolution of the file system; #_write_credentials() replaces
+  the file, which also changes the inode.
+  """
+
+  stat = path.stat()
+  return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _read_credentials(path: Path) -> t.Dict[str, t.Any]:
+  """
+  Internal. Reads a credentials file, reusing the previously parsed content if the file was not modified since.
+  The returned dictionary must not be mutated.
+  """
+
+  path = path.absolute()
+  version = _file_version(path)
+  cached = _CREDENTIALS_CACHE.get(path)
+  if cached is not None and cached[0] == version:
+    return cached[1]
+  data = _json.loads(path.read_bytes())
+  _CREDENTIALS_CACHE[path] = (version, data)
+  return data
+
+
+def _write_credentials(path: Path, data: t.Dict[str, t.Any]) -> None:
+  """
+  Internal. Atomically replaces the credentials file at *path* with *data*, so that concurrent readers never
+  see a partially written file.
+  """
+
+  path = path.absolute()
+  fp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix='.tmp', delete=False)
+  try:
+    with fp:
+      fp.write(_json.dumps(data, indent=2))
+    os.replace(fp.name, path)
+  except BaseException:
+    os.unlink(fp.name)
+    raise
+  _CREDENTIALS_CACHE[path] = (_file_version(path), data)
+
+
 class BaseClient:
   """
   Base class for the Baserow client which handles the authentication and request session.
@@ -31,31 +149,127 @@ class BaseClient:
   A JWT is needed when performing requests that are scoped to user interactions (e.g. operations that
   are expected to be run through the UI). A token should be used if only a subset of the Baserow API
   is used to create/read/write/delete rows.
+
+  Requests are sent through a `requests.Session` that keeps a pool of persistent connections per host. Unless
+  a *session* is passed explicitly, all clients share the session returned by #default_session(), so creating
+  many (short-lived) clients does not cost a new connection every time. An explicit session should be created
+  with #create_session(), so that its pool matches #pool_maxsize. The session only holds connections;
+  the credentials are sent by each client with every request, and it does not store cookies, which it would
+  otherwise send on behalf of every client. Clients and sessions can be used from multiple threads.
   """
 
-  def __init__(self, url: str, token: t.Optional[str] = None, jwt: t.Optional[str] = None) -> None:
+  #: The maximum number of connections to keep open to a Baserow server.
+  pool_maxsize = 16
+
+  #: The retry policy for idempotent requests that failed due to a connection error or an overloaded server.
+  max_retries = Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 502, 503, 504), raise_on_status=False)
+
+  _default_sessions: t.ClassVar[t.Dict[t.Tuple[int, Retry], requests.Session]] = {}
+  _default_session_lock: t.ClassVar[threading.Lock] = threading.Lock()
+
+  def __init__(
+    self,
+    url: str,
+    token: t.Optional[str] = None,
+    jwt: t.Optional[str] = None,
+    session: t.Optional[requests.Session] = None,
+  ) -> None:
     if token and jwt:
       raise ValueError(f'token/jwt can not be specified at the same time')
 
     self._url = url.rstrip('/')
-    self._session = requests.Session()
+    self._session = session or self.default_session()
+    self._auth_headers: t.Dict[str, str] = {}
     self._jwt: t.Optional[str] = None
     self._token: t.Optional[str] = None
 
+    # Holds a simdjson parser per thread, see #_decode_rows().
+    self._sjparsers = threading.local()
+
     if jwt:
       self.jwt = jwt
     elif token:
       self.token = token
 
+  @classmethod
+  def create_session(cls) -> requests.Session:
+    """
+    Create a new `requests.Session` with connection pools of #pool_maxsize connections and the #max_retries
+    retry policy. Connections are pooled for up to `requests.adapters.DEFAULT_POOLSIZE` hosts.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=DEFAULT_POOLSIZE, pool_maxsize=cls.pool_maxsize, max_retries=cls.max_retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+  @classmethod
+  def default_session(cls) -> requests.Session:
+    """
+    Returns the session that is shared by all clients that were not given an explicit session. Client classes
+    with the same #pool_maxsize and #max_retries share a session. The session rejects all cookies.
+    """
+
+    key = (cls.pool_maxsize, cls.max_retries)
+    with BaseClient._default_session_lock:
+      session = BaseClient._default_sessions.get(key)
+      if session is None:
+        session = cls.create_session()
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        BaseClient._default_sessions[key] = session
+      return session
+
   def _request(self, method: str, path: str, **kwargs) -> requests.Response:
-    response = self._session.request(method, self._url + '/' + path.lstrip('/'), **kwargs)
-    if (response.status_code // 100) in (4, 5) and response.headers.get('Content-Type') == 'application/json':
-      data = response.json()
-      log.debug('Error from %s %s: %s', method, path, data)
-      raise ApiError(data.get('error', 'UNKNOWN'), data.get('detail', '???'))
-    response.raise_for_status()
+    return self._request_url(method, self._url + '/' + path.lstrip('/'), **kwargs)
+
+  def _request_url(self, method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Like #_request(), but takes the full URL. Used in hot paths that build the URL once up front.
+
+    A `json` body is encoded with #_json.dumps() instead of letting `requests` encode it with the standard
+    library.
+    """
+
+    headers = {**self._auth_headers, **(kwargs.get('headers') or {})}
+    body = kwargs.pop('json', None)
+    if body is not None:
+      kwargs['data'] = _json.dumps(body)
+      headers.setdefault('Content-Type', 'application/json')
+    kwargs['headers'] = headers
+
+    response = self._session.request(method, url, **kwargs)
+    if response.status_code >= 400:
+      if response.headers.get('Content-Type', '').startswith('application/json'):
+        raise self._api_error(method, url, response.content)
+      # Release the connection of a streamed response, the body is not read.
+      response.close()
+      response.raise_for_status()
     return response
 
+  def _api_error(self, method: str, path: str, content: bytes) -> ApiError:
+    data = _json.loads(content)
+    log.debug('Error from %s %s: %s', method, path, data)
+    return ApiError(data.get('error', 'UNKNOWN'), data.get('detail', '???'))
+
+  def _request_json(self, method: str, path: str, decode_as: t.Any = None, **kwargs) -> t.Any:
+    """
+    Like #_request(), but decodes the JSON response body. The raw bytes are passed to the JSON decoder directly
+    to skip the character set detection that `requests.Response.json()` performs. If *decode_as* is specified,
+    the body is deserialized into that type, in a single pass with [msgspec](https://jcristharif.com/msgspec/)
+    if it is installed and supports the type, or with databind otherwise.
+    """
+
+    return self._decode(self._request(method, path, **kwargs).content, decode_as)
+
+  def _decode(self, content: bytes, decode_as: t.Any = None) -> t.Any:
+    if decode_as is None:
+      return _json.loads(content)
+    decoder = _MSGSPEC_DECODERS.get(decode_as)
+    if decoder is not None:
+      return decoder.decode(content)
+    return databind.json.load(_json.loads(content), decode_as)
+
   @property
   def jwt(self) -> t.Optional[str]:
     return self._jwt
@@ -64,7 +278,7 @@ class BaseClient:
   def jwt(self, jwt: str) -> None:
     self._jwt = jwt
     self._token = None
-    self._session.headers['Authorization'] = f'JWT {jwt}'
+    self._auth_headers = {'Authorization': f'JWT {jwt}'}
 
   @property
   def token(self) -> t.Optional[str]:
@@ -74,7 +288,7 @@ class BaseClient:
   def token(self, token: str) -> None:
     self._jwt = None
     self._token = token
-    self._session.headers['Authorization'] = f'Token {token}'
+    self._auth_headers = {'Authorization': f'Token {token}'}
 
 
 class BaserowClient(BaseClient):
@@ -83,20 +297,24 @@ class BaserowClient(BaseClient):
   """
 
   def get_settings(self) -> t.Dict[str, t.Any]:
-    return self._request('GET', '/api/settings/').json()
+    return self._request_json('GET', '/api/settings/')
 
   def update_settings(self, settings: t.Dict[str, t.Any]) -> None:
     self._request('PATCH', '/api/settings/update/', json=settings)
 
   def token_auth(self, username: str, password: str) -> t.Tuple[User, str]:
     payload = {'username': username, 'password': password}
-    response = self._request('POST', '/api/user/token-auth/', json=payload).json()
-    return databind.json.load(response['user'], User), response['token']
+    response = self._request_json('POST', '/api/user/token-auth/', json=payload, decode_as=_UserResponse)
+    if response.token is None:
+      raise ApiError('ERROR_MISSING_TOKEN', 'The response does not contain a token.')
+    return response.user, response.token
 
   def token_refresh(self, token: str) -> t.Tuple[User, str]:
     payload = {'token': token}
-    response = self._request('POST', '/api/user/token-refresh/', json=payload).json()
-    return databind.json.load(response['user'], User), response['token']
+    response = self._request_json('POST', '/api/user/token-refresh/', json=payload, decode_as=_UserResponse)
+    if response.token is None:
+      raise ApiError('ERROR_MISSING_TOKEN', 'The response does not contain a token.')
+    return response.user, response.token
 
   def create_user(
     self,
@@ -116,36 +334,30 @@ class BaserowClient(BaseClient):
     if template_id:
       payload['template_id'] = template_id
 
-    response = self._request('POST', '/api/user/', json=payload).json()
-    return databind.json.load(response['user'], User), response.get('token')
+    response = self._request_json('POST', '/api/user/', json=payload, decode_as=_UserResponse)
+    return response.user, response.token
 
   def list_groups(self) -> t.List[PermissionedOrderedGroup]:
-    response = self._request('GET', '/api/groups/').json()
-    return databind.json.load(response, t.List[PermissionedOrderedGroup])
+    return self._request_json('GET', '/api/groups/', decode_as=t.List[PermissionedOrderedGroup])
 
   def create_group(self, name: str) -> PermissionedOrderedGroup:
-    response = self._request('POST', '/api/groups/', json={'name': name}).json()
-    return databind.json.load(response, PermissionedOrderedGroup)
+    return self._request_json('POST', '/api/groups/', json={'name': name}, decode_as=PermissionedOrderedGroup)
 
   def list_all_applications(self) -> t.List[Application]:
-    response = self._request('GET', '/api/applications/').json()
-    return databind.json.load(response, t.List[Application])
+    return self._request_json('GET', '/api/applications/', decode_as=t.List[Application])
 
   def get_database_table(self, table_id: int) -> Table:
-    response = self._request('GET', f'/api/database/tables/{table_id}/').json()
-    return databind.json.load(response, Table)
+    return self._request_json('GET', f'/api/database/tables/{table_id}/', decode_as=Table)
 
   def update_database_table(self, table_id: int, name: str) -> Table:
-    response = self._request('PATCH', f'/api/database/tables/{table_id}/', json={'name': name}).json()
-    return databind.json.load(response, Table)
+    return self._request_json('PATCH', f'/api/database/tables/{table_id}/', json={'name': name}, decode_as=Table)
 
   def list_database_tables(self, database_id: int) -> t.List[Table]:
-    response = self._request('GET', f'/api/database/tables/database/{database_id}/').json()
-    return databind.json.load(response, t.List[Table])
+    return self._request_json('GET', f'/api/database/tables/database/{database_id}/', decode_as=t.List[Table])
 
   def list_database_table_fields(self, table_id: int) -> t.List[TableField]:
-    response = self._request('GET', f'/api/database/fields/table/{table_id}/').json()
-    return databind.json.load(response, t.List[TableField])
+    response = self._request_json('GET', f'/api/database/fields/table/{table_id}/')
+    return [load_table_field(x) for x in response]
 
   def list_database_table_rows(
     self,
@@ -161,44 +373,155 @@ class BaserowClient(BaseClient):
     user_field_names: bool = False,
   ) -> Page[t.Dict[str, t.Any]]:
 
-    params: t.Dict[str, t.Optional[str]] = {}
+    url = f'{self._url}/api/database/rows/table/{table_id}/'
+    params = self._list_rows_params(exclude, filter, filter_type, include, order_by, search, size, user_field_names)
+    return self._list_rows_page(url, params, page)
+
+  def _list_rows_page(
+    self,
+    url: str,
+    params: t.List[t.Tuple[str, t.Optional[str]]],
+    page: t.Optional[int],
+  ) -> Page[t.Dict[str, t.Any]]:
+
+    if page is not None:
+      params = params + [('page', str(page))]
+    response = self._request_url('GET', url, params=params, stream=True)
+    content = b''.join(response.iter_content(_READ_CHUNK_SIZE))
+    return self._make_rows_page(content, page)
+
+  def _list_rows_params(
+    self,
+    exclude: t.Optional[t.List[str]],
+    filter: t.Optional[t.List[Filter]],
+    filter_type: t.Optional[FilterType],
+    include: t.Optional[t.List[str]],
+    order_by: t.Optional[t.List[str]],
+    search: t.Optional[str],
+    size: t.Optional[int],
+    user_field_names: bool,
+  ) -> t.List[t.Tuple[str, t.Optional[str]]]:
+    """
+    Builds the query parameters for listing rows, except for the page number. The result can be reused for
+    every page of a paginated request.
+    """
+
+    params: t.List[t.Tuple[str, t.Optional[str]]] = []
+    if filter:
+      params.extend(to_query_parameters(filter).items())
+    if size is not None:
+      params.append(('size', str(size)))
     if exclude is not None:
-      params['exclude'] = ','.join(exclude)
-    if filter is not None:
-      params.update(dict(f.to_query_parameter() for f in filter))
+      params.append(('exclude', ','.join(exclude)))
     if filter_type is not None:
-      params['filter_type'] = filter_type.name
+      params.append(('filter_type', filter_type.name))
     if include is not None:
-      params['include'] = ','.join(include)
+      params.append(('include', ','.join(include)))
     if order_by is not None:
-      params['order_by'] = ','.join(order_by)
-    if page is not None:
-      params['page'] = str(page)
+      params.append(('order_by', ','.join(order_by)))
     if search is not None:
-      params['search'] = search
-    if size is not None:
-      params['size'] = str(size)
+      params.append(('search', search))
     if user_field_names:
-      params['user_field_names'] = 'True'
+      params.append(('user_field_names', 'True'))
+    return params
 
-    response = self._request('GET', f'/api/database/rows/table/{table_id}/', params=params).json()
+  def _make_rows_page(self, content: bytes, page: t.Optional[int]) -> Page[t.Dict[str, t.Any]]:
+    count, has_next, results = self._decode_rows(content)
     if page is None:
       page = 1
 
     return Page(
-      response['count'],
+      count,
       page - 1 if page > 1 else None,
-      page + 1 if response['next'] else None,
-      response['results'])
+      page + 1 if has_next else None,
+      results)
+
+  def _decode_rows(self, content: bytes) -> t.Tuple[int, bool, t.List[t.Dict[str, t.Any]]]:
+    """
+    Decodes a page of rows into the total row count, whether there is a next page and the rows. Uses the
+    [pysimdjson](https://github.com/TkTech/pysimdjson) parser if it is installed, which is significantly faster
+    for large pages.
+    """
+
+    if not _HAS_SIMDJSON:
+      data = _json.loads(content)
+      return data['count'], bool(data['next']), data['results']
+
+    # NOTE: The parser can only be reused once all proxy objects referencing the previous document have
+    #       been released, which is why the results are fully materialized before returning. For the same
+    #       reason, every thread needs its own parser. It is reused for every page of rows that the thread
+    #       decodes, so that simdjson can recycle its internal buffers.
+    parser = getattr(self._sjparsers, 'parser', None)
+    if parser is None:
+      parser = self._sjparsers.parser = simdjson.Parser()
+    doc: t.Any = parser.parse(content)
+    try:
+      return doc['count'], bool(doc['next']), doc.at_pointer('/results').as_list()
+    finally:
+      del doc
 
   def create_database_table_row(self, table_id: int, record: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
-    return self._request('POST', f'/api/database/rows/table/{table_id}/', json=record).json()
+    return self._request_json('POST', f'/api/database/rows/table/{table_id}/', json=record)
 
   def update_database_table_row(self, table_id: int, row_id: int, record: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
-    return self._request('PATCH', f'/api/database/rows/table/{table_id}/{row_id}/', json=record).json()
+    url = f'{self._url}/api/database/rows/table/{table_id}/{row_id}/'
+    return self._decode(self._request_url('PATCH', url, json=record).content)
 
   def get_database_table_row(self, table_id: int, row_id: int) -> t.Dict[str, t.Any]:
-    return self._request('GET', f'/api/database/rows/table/{table_id}/{row_id}/').json()
+    url = f'{self._url}/api/database/rows/table/{table_id}/{row_id}/'
+    return self._decode(self._request_url('GET', url).content)
+
+  def create_database_table_rows(
+    self,
+    table_id: int,
+    records: t.Iterable[t.Dict[str, t.Any]],
+  ) -> t.List[t.Dict[str, t.Any]]:
+    """
+    Create multiple rows using the batch endpoint. The *records* are consumed and sent in chunks of
+    #BATCH_SIZE rows, requiring only one request per chunk instead of one request per row.
+
+    The operation is not atomic across chunks. If a chunk fails after rows were already created, a
+    #BatchError with the created rows is raised.
+    """
+
+    return self._batch_request('POST', table_id, records)
+
+  def update_database_table_rows(
+    self,
+    table_id: int,
+    records: t.Iterable[t.Dict[str, t.Any]],
+  ) -> t.List[t.Dict[str, t.Any]]:
+    """
+    Update multiple rows using the batch endpoint. Every record must contain the `id` of the row to update.
+    The *records* are sent in chunks of #BATCH_SIZE rows.
+
+    The operation is not atomic across chunks. If a chunk fails after rows were already updated, a
+    #BatchError with the updated rows is raised.
+    """
+
+    return self._batch_request('PATCH', table_id, records)
+
+  def _batch_request(
+    self,
+    method: str,
+    table_id: int,
+    records: t.Iterable[t.Dict[str, t.Any]],
+  ) -> t.List[t.Dict[str, t.Any]]:
+
+    path = f'/api/database/rows/table/{table_id}/batch/'
+    result: t.List[t.Dict[str, t.Any]] = []
+    it = iter(records)
+    while True:
+      chunk = list(itertools.islice(it, BATCH_SIZE))
+      if not chunk:
+        break
+      try:
+        result += self._request_json(method, path, json={'items': chunk})['items']
+      except Exception as exc:
+        if not result:
+          raise
+        raise BatchError(result, exc) from exc
+    return result
 
   # Extra
 
@@ -235,8 +558,8 @@ class BaserowClient(BaseClient):
       return None
 
     try:
-      data = json.loads(path.read_text())
-    except json.JSONDecodeError:
+      data = _read_credentials(path)
+    except _json.JSONDecodeError:
       log.error('Unable to parse JSON file %s', path)
       if raise_:
         raise
@@ -260,9 +583,10 @@ class BaserowClient(BaseClient):
       raise ValueError(f'No JWT set')
 
     path = Path(filename or DEFAULT_CREDENTIALS_FILE)
-    data = json.loads(path.read_text()) if path.exists() else {}
-    data.setdefault(self._url, {})[username] = self.jwt
-    path.write_text(json.dumps(data, indent=2))
+    data = _read_credentials(path) if path.exists() else {}
+    users = data.get(self._url, {})
+    if users.get(username) != self.jwt:
+      _write_credentials(path, {**data, self._url: {**users, username: self.jwt}})
 
   def paginated_database_table_rows(
     self,
@@ -277,22 +601,68 @@ class BaserowClient(BaseClient):
     user_field_names: bool = False,
   ) -> t.Generator[Page[t.Dict[str, t.Any]], None, None]:
 
+    url = f'{self._url}/api/database/rows/table/{table_id}/'
+    params = self._list_rows_params(exclude, filter, filter_type, include, order_by, search, size, user_field_names)
     page_number = None
     while True:
-      page = self.list_database_table_rows(
-        table_id=table_id,
-        exclude=exclude,
-        filter=filter,
-        filter_type=filter_type,
-        include=include,
-        order_by=order_by,
-        page=page_number,
-        search=search,
-        size=size,
-        user_field_names=user_field_names,
-      )
+      page = self._list_rows_page(url, params, page_number)
       if page.results:
         yield page
       if not page.next:
         break
       page_number = page.next
+
+  async def async_paginated_database_table_rows(
+    self,
+    table_id: int,
+    exclude: t.Optional[t.List[str]] = None,
+    filter: t.Optional[t.List[Filter]] = None,
+    filter_type: t.Optional[FilterType] = None,
+    include: t.Optional[t.List[str]] = None,
+    order_by: t.Optional[t.List[str]] = None,
+    search: t.Optional[str] = None,
+    size: t.Optional[int] = None,
+    user_field_names: bool = False,
+  ) -> t.AsyncGenerator[Page[t.Dict[str, t.Any]], None]:
+    """
+    The asynchronous counterpart of #paginated_database_table_rows(). The next page is requested as soon as
+    the current page is received, so the request is in flight while the caller processes the current page.
+
+    Requires [httpx](https://www.python-httpx.org/). HTTP/2 is used if the `h2` package is installed.
+    """
+
+    if not _HAS_HTTPX:
+      raise RuntimeError('async_paginated_database_table_rows() requires httpx to be installed')
+
+    path = f'/api/database/rows/table/{table_id}/'
+    params = self._list_rows_params(exclude, filter, filter_type, include, order_by, search, size, user_field_names)
+    query = tuple((k, v) for k, v in params if v is not None)
+
+    async with httpx.AsyncClient(
+      base_url=self._url,
+      headers=self._auth_headers,
+      http2=importlib.util.find_spec('h2') is not None,
+      limits=httpx.Limits(max_keepalive_connections=self.pool_maxsize),
+    ) as client:
+
+      async def fetch(page_number: t.Optional[int]) -> Page[t.Dict[str, t.Any]]:
+        page_params = query if page_number is None else query + (('page', str(page_number)),)
+        response = await client.get(path, params=page_params)
+        if response.status_code >= 400:
+          if response.headers.get('Content-Type', '').startswith('application/json'):
+            raise self._api_error('GET', path, response.content)
+          response.raise_for_status()
+        return self._make_rows_page(response.content, page_number)
+
+      task = asyncio.ensure_future(fetch(None))
+      try:
+        while True:
+          page = await task
+          if page.next:
+            task = asyncio.ensure_future(fetch(page.next))
+          if page.results:
+            yield page
+          if not page.next:
+            break
+      finally:
+        task.cancel()
@@ -0,0 +1,266 @@
+
+import asyncio
+import email
+import http.client
+import io
+import os
+import threading
+import typing as t
+from pathlib import Path
+
+import databind.json
+import pytest
+import requests
+
+from baserow import _json, client as _client
+from baserow.client import _HAS_MSGSPEC, _HAS_SIMDJSON, _MSGSPEC_DECODERS, BATCH_SIZE, ApiError, BaseClient, BatchError, BaserowClient, _UserResponse
+from baserow.types import Application, User
+
+
+def make_rows_page(num_rows: int, has_next: bool = False) -> bytes:
+  rows = [{'id': i, 'order': str(i), 'field_1': f'row {i}', 'field_2': [{'id': i, 'value': 'x'}]} for i in range(num_rows)]
+  return _json.dumps({'count': num_rows, 'next': 'http://next' if has_next else None, 'previous': None, 'results': rows})
+
+
+@pytest.mark.skipif(not _HAS_SIMDJSON, reason='requires pysimdjson')
+def test__BaserowClient__decode_rows__from_multiple_threads() -> None:
+  client = BaserowClient('http://baserow')
+  content = make_rows_page(500)
+  expected = _json.loads(content)['results']
+  barrier = threading.Barrier(4)
+  errors: t.List[BaseException] = []
+
+  def worker() -> None:
+    barrier.wait()
+    try:
+      for _ in range(20):
+        assert client._decode_rows(content) == (500, False, expected)
+    except BaseException as exc:
+      errors.append(exc)
+
+  threads = [threading.Thread(target=worker) for _ in range(4)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  assert errors == []
+
+
+def test__BaserowClient__decode__does_not_depend_on_msgspec() -> None:
+  """
+  Tests that responses with unknown keys decode to the same objects with msgspec and with databind.
+  """
+
+  client = BaserowClient('http://baserow')
+  user = {'id': 1, 'first_name': 'John', 'username': 'john@example.org', 'is_staff': False, 'language': 'en', 'email': 'x'}
+  application = {
+    'id': 1, 'name': 'Blog', 'order': 1, 'type': 'database', 'created_on': '2023-01-01',
+    'workspace': {'id': 2, 'name': 'Workspace', 'generative_ai_models_enabled': ''},
+    'tables': [{'id': 3, 'name': 'Posts', 'order': 1, 'database_id': 1, 'data_sync': None}],
+    'group': {'id': 2, 'name': 'Workspace', 'unknown': True},
+  }
+  samples: t.List[t.Tuple[t.Any, t.Any]] = [
+    (User, user),
+    (_UserResponse, {'user': user, 'token': 'jwt', 'access_token': 'jwt', 'refresh_token': 'jwt'}),
+    (t.List[Application], [application]),
+  ]
+  for type_, data in samples:
+    if _HAS_MSGSPEC:
+      assert type_ in _MSGSPEC_DECODERS
+    assert client._decode(_json.dumps(data), type_) == databind.json.load(data, type_)
+
+
+def test__BaserowClient__async_paginated_database_table_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+  httpx = pytest.importorskip('httpx')
+  requests: t.List[t.Any] = []
+  events: t.Dict[str, asyncio.Event] = {}
+
+  async def handler(request: t.Any) -> t.Any:
+    requests.append(request)
+    page = int(request.url.params.get('page', '1'))
+    if page == 3:
+      events['blocked'].set()
+      try:
+        await asyncio.sleep(10)
+      except asyncio.CancelledError:
+        events['cancelled'].set()
+        raise
+    return httpx.Response(200, content=make_rows_page(2, has_next=True))
+
+  async_client = httpx.AsyncClient
+  transport = httpx.MockTransport(handler)
+  monkeypatch.setattr(httpx, 'AsyncClient', lambda **kwargs: async_client(transport=transport, **kwargs))
+  client = BaserowClient('http://baserow', token='secret')
+
+  async def main() -> None:
+    # NOTE: Created here because events are bound to the running event loop before Python 3.10.
+    events.update(blocked=asyncio.Event(), cancelled=asyncio.Event())
+    pages = client.async_paginated_database_table_rows(42, size=2)
+    assert (await pages.__anext__()).next == 2
+    assert (await pages.__anext__()).previous == 1
+    # The third page is requested in the background. Closing the generator early cancels that request.
+    await asyncio.wait_for(events['blocked'].wait(), 1)
+    await pages.aclose()
+    await asyncio.wait_for(events['cancelled'].wait(), 1)
+
+  asyncio.run(main())
+  assert [r.url.path for r in requests] == ['/api/database/rows/table/42/'] * 3
+  assert [r.url.params.get('page') for r in requests] == [None, '2', '3']
+  assert all(r.url.params['size'] == '2' for r in requests)
+  assert all(r.headers['Authorization'] == 'Token secret' for r in requests)
+
+
+def test__BaserowClient__batch_requests_are_sent_in_chunks() -> None:
+  client = BaserowClient('http://baserow', token='secret')
+  calls: t.List[t.Tuple[str, str, int, t.Dict[str, t.Any]]] = []
+  produced = 0
+
+  def request_url(method: str, url: str, json: t.Dict[str, t.Any]) -> t.Any:
+    calls.append((method, url, produced, json))
+    content = _json.dumps({'items': [{'id': record['n'] + 1000, **record} for record in json['items']]})
+    return type('Response', (), {'content': content})
+
+  def records() -> t.Iterator[t.Dict[str, t.Any]]:
+    nonlocal produced
+    for n in range(BATCH_SIZE * 2 + 50):
+      produced += 1
+      yield {'n': n}
+
+  client._request_url = request_url  # type: ignore[assignment]
+  result = client.create_database_table_rows(42, records())
+  assert [r['id'] for r in result] == [n + 1000 for n in range(BATCH_SIZE * 2 + 50)]
+  assert [(method, url) for method, url, _, _ in calls] == [('POST', 'http://baserow/api/database/rows/table/42/batch/')] * 3
+  assert [len(body['items']) for _, _, _, body in calls] == [BATCH_SIZE, BATCH_SIZE, 50]
+  assert [body.keys() for _, _, _, body in calls] == [{'items'}] * 3
+  # The records are consumed one chunk at a time.
+  assert [n for _, _, n, _ in calls] == [BATCH_SIZE, BATCH_SIZE * 2, BATCH_SIZE * 2 + 50]
+
+  calls.clear()
+  result = client.update_database_table_rows(42, [{'id': 1, 'n': 1}])
+  assert result == [{'id': 1, 'n': 1}]
+  assert [method for method, _, _, _ in calls] == ['PATCH']
+  assert client.create_database_table_rows(42, []) == []
+
+
+def test__BaserowClient__batch_requests_report_applied_chunks_on_error() -> None:
+  client = BaserowClient('http://baserow', token='secret')
+  responses: t.List[t.Any] = [{'items': [{'id': 1}] * BATCH_SIZE}, ApiError('ERROR_REQUEST_BODY_VALIDATION', '')]
+
+  def request_json(method: str, path: str, json: t.Dict[str, t.Any]) -> t.Any:
+    response = responses.pop(0)
+    if isinstance(response, Exception):
+      raise response
+    return response
+
+  client._request_json = request_json  # type: ignore[assignment]
+  with pytest.raises(BatchError) as excinfo:
+    client.create_database_table_rows(42, [{}] * (BATCH_SIZE + 1))
+  assert excinfo.value.results == [{'id': 1}] * BATCH_SIZE
+  assert isinstance(excinfo.value.error, ApiError)
+
+  # Nothing was applied if the first chunk fails, so the error is raised as is.
+  responses.append(ApiError('ERROR_REQUEST_BODY_VALIDATION', ''))
+  with pytest.raises(ApiError):
+    client.update_database_table_rows(42, [{'id': 1}])
+
+
+def test__BaserowClient__token_auth__requires_a_token(monkeypatch: pytest.MonkeyPatch) -> None:
+  client = BaserowClient('http://baserow')
+  user = {'id': 1, 'first_name': 'John', 'username': 'john@example.org', 'is_staff': False, 'language': 'en'}
+  response = client._decode(_json.dumps({'user': user}), _UserResponse)
+  monkeypatch.setattr(client, '_request_json', lambda *args, **kwargs: response)
+  with pytest.raises(ApiError):
+    client.token_auth('john', 'secret')
+  with pytest.raises(ApiError):
+    client.token_refresh('jwt')
+
+
+def test__read_credentials__reuses_the_file_until_it_is_modified(tmp_path: Path) -> None:
+  path = tmp_path / 'creds.json'
+  path.write_bytes(_json.dumps({'http://baserow': {'john': 'a'}}))
+  data = _client._read_credentials(path)
+  assert data == {'http://baserow': {'john': 'a'}}
+  assert _client._read_credentials(path) is data
+
+  mtime = path.stat().st_mtime_ns
+  path.write_bytes(_json.dumps({'http://baserow': {'john': 'b'}}))
+  os.utime(path, ns=(0, mtime + 1))
+  assert _client._read_credentials(path) == {'http://baserow': {'john': 'b'}}
+
+  # Rewritten by another process within the same timestamp.
+  _client._write_credentials(path.with_name('other.json'), {'http://baserow': {'john': 'c', 'jane': 'd'}})
+  os.utime(path.with_name('other.json'), ns=(0, mtime + 1))
+  os.replace(path.with_name('other.json'), path)
+  assert _client._read_credentials(path) == {'http://baserow': {'john': 'c', 'jane': 'd'}}
+
+
+def test__BaserowClient__save__writes_credentials_only_if_changed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+  path = tmp_path / 'creds.json'
+  writes: t.List[t.Dict[str, t.Any]] = []
+  write_credentials = _client._write_credentials
+
+  def recording_write_credentials(path: Path, data: t.Dict[str, t.Any]) -> None:
+    writes.append(data)
+    write_credentials(path, data)
+
+  monkeypatch.setattr(_client, '_write_credentials', recording_write_credentials)
+  client = BaserowClient('http://baserow', jwt='a')
+  client.save('john', str(path))
+  client.save('john', str(path))
+  assert writes == [{'http://baserow': {'john': 'a'}}]
+  client.jwt = 'b'
+  client.save('john', str(path))
+  assert writes[1:] == [{'http://baserow': {'john': 'b'}}]
+  assert _json.loads(path.read_bytes()) == {'http://baserow': {'john': 'b'}}
+
+
+def test__write_credentials__removes_the_temporary_file_on_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+  path = tmp_path / 'creds.json'
+  _client._write_credentials(path, {'http://baserow': {'john': 'a'}})
+
+  def failing_dumps(obj: t.Any, indent: t.Optional[int] = None) -> bytes:
+    raise TypeError('not serializable')
+
+  monkeypatch.setattr(_json, 'dumps', failing_dumps)
+  with pytest.raises(TypeError):
+    _client._write_credentials(path, {'http://baserow': {'john': object()}})
+  assert [p.name for p in tmp_path.iterdir()] == ['creds.json']
+  assert _client._read_credentials(path) == {'http://baserow': {'john': 'a'}}
+
+
+def test__BaseClient__default_session__rejects_cookies() -> None:
+  def receive_cookie(session: requests.Session) -> t.Dict[str, str]:
+    msg = email.message_from_string('Set-Cookie: sessionid=abc; Path=/\n\n', _class=http.client.HTTPMessage)
+    raw = type('Raw', (), {'_original_response': type('Response', (), {'msg': msg})})
+    request = requests.Request('GET', 'http://baserow/api/').prepare()
+    requests.cookies.extract_cookies_to_jar(session.cookies, request, raw)
+    return dict(session.cookies)
+
+  assert receive_cookie(BaseClient.create_session()) == {'sessionid': 'abc'}
+  assert receive_cookie(BaseClient.default_session()) == {}
+
+
+def test__BaseClient__default_session__matches_the_client_class() -> None:
+  class SmallClient(BaserowClient):
+    pool_maxsize = 4
+
+  session = SmallClient('http://baserow')._session
+  assert session is SmallClient.default_session()
+  assert session is not BaserowClient.default_session()
+  assert BaserowClient('http://baserow')._session is BaseClient.default_session()
+  adapter = session.get_adapter('https://baserow')
+  assert adapter._pool_maxsize == 4  # type: ignore[attr-defined]
+  assert adapter._pool_connections == requests.adapters.DEFAULT_POOLSIZE  # type: ignore[attr-defined]
+
+
+def test__BaseClient__closes_streamed_error_responses() -> None:
+  raw = io.BytesIO(b'<html>Bad Gateway</html>')
+  response = requests.Response()
+  response.status_code = 502
+  response.headers['Content-Type'] = 'text/html'
+  response.raw = raw
+  session = type('Session', (), {'request': lambda *args, **kwargs: response})()
+  client = BaserowClient('http://baserow', session=session)
+  with pytest.raises(requests.HTTPError):
+    client.list_database_table_rows(42)
+  assert raw.closed
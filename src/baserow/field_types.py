@@ -3,66 +3,115 @@ import dataclasses
 import enum
 import typing as t
 
+import databind.json
 from databind.core.settings import Union
 
+from ._compat import DATACLASS_SLOTS
 from .types import TableField
 
+T_TableField = t.TypeVar('T_TableField', bound=t.Type[TableField])
+
+#: Maps the `type` discriminator of a #TableField to its subclass.
+_TABLE_FIELD_TYPES: t.Dict[str, t.Type[TableField]] = {}
+
+
+def _table_field(type_: str) -> t.Callable[[T_TableField], T_TableField]:
+  """
+  Registers the decorated class as a #TableField union member for databind and in #_TABLE_FIELD_TYPES.
+  """
+
+  def decorator(cls: T_TableField) -> T_TableField:
+    Union.register(TableField, type_)(cls)
+    _TABLE_FIELD_TYPES[type_] = cls
+    return cls
+
+  return decorator
+
 
 class NumberType(enum.Enum):
   INTEGER = enum.auto()
   DECIMAL = enum.auto()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class SelectOption:
   id: int
   value: str
   color: str
 
 
-@Union.register(TableField, 'text')
-@dataclasses.dataclass
+@_table_field('text')
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class TextTableField(TableField):
   text_default: str
 
 
-@Union.register(TableField, 'long_text')
-@dataclasses.dataclass
+@_table_field('long_text')
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class LongTextTableField(TableField): pass
 
 
-@Union.register(TableField, 'number')
-@dataclasses.dataclass
+@_table_field('number')
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class NumberTableField(TableField):
   number_decimal_places: int
   number_negative: bool
   number_type: NumberType
 
 
-@Union.register(TableField, 'single_select')
-@dataclasses.dataclass
+@_table_field('single_select')
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class SingleSelectTableField(TableField):
   select_options: t.List[SelectOption]
 
 
-@Union.register(TableField, 'url')
-@dataclasses.dataclass
+@_table_field('url')
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class UrlTableField(TableField):
   pass
 
 
-@Union.register(TableField, 'link_row')
-@dataclasses.dataclass
+@_table_field('link_row')
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class LinkRowTableField(TableField):
   link_row_table: int
   link_row_related_field: int
 
 
-@Union.register(TableField, 'boolean')
-@dataclasses.dataclass
+@_table_field('boolean')
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class BooleanTableField(TableField): pass
 
 
-@Union.register(TableField, 'file')
-@dataclasses.dataclass
+@_table_field('file')
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class FileTableField(TableField): pass
+
+
+_NUMBER_TYPES = {m.name: m for m in NumberType}
+
+#: Converters for #TableField attributes whose JSON value is not used as-is, keyed by the attribute type.
+_CONVERTERS: t.Dict[t.Any, t.Callable[[t.Any], t.Any]] = {
+  NumberType: _NUMBER_TYPES.__getitem__,
+  t.List[SelectOption]: lambda value: [SelectOption(x['id'], x['value'], x['color']) for x in value],
+}
+
+#: The #TableField subclass and its attributes with their optional converter, for every `type` discriminator.
+_TABLE_FIELD_LOADERS = {
+  type_: (cls, [(f.name, _CONVERTERS.get(f.type)) for f in dataclasses.fields(cls)])
+  for type_, cls in _TABLE_FIELD_TYPES.items()
+}
+
+
+def load_table_field(data: t.Dict[str, t.Any]) -> TableField:
+  """
+  Deserialize a #TableField from its JSON representation. Unlike `databind.json.load(data, TableField)`, this
+  dispatches on the `type` with a single dictionary lookup and ignores keys that are not known to the subclass.
+  Falls back to databind for field types that are not registered in this module.
+  """
+
+  loader = _TABLE_FIELD_LOADERS.get(data['type'])
+  if loader is None:
+    return databind.json.load(data, TableField)
+  cls, fields = loader
+  return cls(**{name: data[name] if conv is None else conv(data[name]) for name, conv in fields})
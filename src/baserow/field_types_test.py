@@ -1,7 +1,7 @@
 
 from databind.json import load, dump
 from baserow.types import TableField
-from baserow.field_types import TextTableField, NumberTableField, NumberType
+from baserow.field_types import TextTableField, NumberTableField, NumberType, load_table_field
 
 
 def test__TableField__can_deserialize_into_union_subtypes() -> None:
@@ -18,3 +18,21 @@ def test__TableField__can_deserialize_into_union_subtypes() -> None:
     number_field_data = {"type": "number", "id": 42, "table_id": 1, "name": "foo", "order": 0, "primary": False, "number_decimal_places": 2, "number_negative": False, "number_type": "INTEGER"}
     assert dump(number_field, TableField) == number_field_data
     assert load(number_field_data, TableField) == number_field
+
+
+def test__load_table_field__matches_databind() -> None:
+  """
+  Tests that #load_table_field() produces the same objects as databind and ignores unknown keys.
+  """
+
+  select_field_data = {
+    "type": "single_select", "id": 42, "table_id": 1, "name": "foo", "order": 0, "primary": False,
+    "select_options": [{"id": 1, "value": "a", "color": "blue"}],
+  }
+  number_field_data = {
+    "type": "number", "id": 42, "table_id": 1, "name": "foo", "order": 0, "primary": False,
+    "number_decimal_places": 2, "number_negative": False, "number_type": "DECIMAL",
+  }
+  for data in (select_field_data, number_field_data):
+    assert load_table_field(data) == load(data, TableField)
+    assert load_table_field({**data, "unknown": None}) == load(data, TableField)
@@ -2,8 +2,12 @@
 import dataclasses
 import datetime
 import enum
+import functools
+import sys
 import typing as t
 
+from ._compat import DATACLASS_SLOTS
+
 Orderable = t.Union[int, float]
 BasicType = t.Union[bool, str, Orderable]
 Date = t.Union[datetime.date, datetime.datetime]
@@ -15,48 +19,87 @@ class FilterType(enum.Enum):
   AND = enum.auto()
 
 
-class FilterMode(enum.Enum):
-  equal = enum.auto()
-  not_equal = enum.auto()
-  filename_contains = enum.auto()
-  contains = enum.auto()
-  contains_not = enum.auto()
-  higher_than = enum.auto()
-  lower_than = enum.auto()
-  date_equal = enum.auto()
-  date_before = enum.auto()
-  date_after = enum.auto()
-  date_not_equal = enum.auto()
-  date_equals_today = enum.auto()
-  date_equals_month = enum.auto()
-  date_equals_year = enum.auto()
-  single_select_equal = enum.auto()
-  single_select_not_equal = enum.auto()
-  link_row_has = enum.auto()
-  link_row_has_not = enum.auto()
-  boolean = enum.auto()
-  empty = enum.auto()
-  not_empty = enum.auto()
-
-
-@dataclasses.dataclass
+class FilterMode(enum.IntEnum):
+  equal = 1
+  not_equal = 2
+  filename_contains = 3
+  contains = 4
+  contains_not = 5
+  higher_than = 6
+  lower_than = 7
+  date_equal = 8
+  date_before = 9
+  date_after = 10
+  date_not_equal = 11
+  date_equals_today = 12
+  date_equals_month = 13
+  date_equals_year = 14
+  single_select_equal = 15
+  single_select_not_equal = 16
+  link_row_has = 17
+  link_row_has_not = 18
+  boolean = 19
+  empty = 20
+  not_empty = 21
+
+  # NOTE: Format members like a plain #enum.Enum, like before this became an #enum.IntEnum. An #enum.IntEnum
+  #       formats as its integer value, and on Python 3.11+ also converts to a string as its integer value.
+
+  def __str__(self) -> str:
+    return f'{type(self).__name__}.{self.name}'
+
+  def __format__(self, format_spec: str) -> str:
+    return format(str(self), format_spec)
+
+
+#: The `__<mode>` suffix of the query parameter key for every #FilterMode, indexed by `mode - 1`.
+_FILTER_SUFFIXES: t.Tuple[str, ...] = tuple(sys.intern(f'__{m.name}') for m in FilterMode)
+
+#: Formatters for filter values by type. Other types are formatted with `str()`, which is cached here on first use.
+_FORMATTERS: t.Dict[type, t.Callable[[t.Any], str]] = {
+  datetime.datetime: lambda v: v.strftime('%Y-%m-%dT%H:%M:%S%z'),
+  datetime.date: lambda v: v.strftime('%Y-%m-%d'),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _query_parameter_key(field: str, mode: FilterMode) -> str:
+  return 'filter__' + field + _FILTER_SUFFIXES[mode - 1]
+
+
+def _get_formatter(type_: type) -> t.Callable[[t.Any], str]:
+  formatter = _FORMATTERS.get(type_)
+  if formatter is None:
+    # Resolve subclasses (e.g. of #datetime.date) once and remember the result for the type.
+    formatter = next((_FORMATTERS[base] for base in type_.__mro__ if base in _FORMATTERS), str)
+    _FORMATTERS[type_] = formatter
+  return formatter
+
+
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class Filter:
   field: str
   filter: FilterMode
   value: t.Optional[ValueType]
 
   def to_query_parameter(self) -> t.Tuple[str, t.Optional[str]]:
-    key = f'filter__{self.field}__{self.filter.name}'
-    value: t.Optional[str]
-    if isinstance(self.value, datetime.datetime):
-      value = self.value.strftime('%Y-%m-%dT%H:%M:%S%z')
-    elif isinstance(self.value, datetime.date):
-      value = self.value.strftime('%Y-%m-%d')
-    elif self.value is None:
-      value = None
-    else:
-      value = str(self.value)
-    return (key, value)
+    key = _query_parameter_key(self.field, self.filter)
+    if self.value is None:
+      return (key, None)
+    return (key, _get_formatter(type(self.value))(self.value))
+
+
+def to_query_parameters(filters: t.Iterable[Filter]) -> t.Dict[str, t.Optional[str]]:
+  """
+  Convert *filters* to a dictionary of query parameters. Equivalent to `dict(f.to_query_parameter() for f in
+  filters)`, but without allocating an intermediate tuple for every filter.
+  """
+
+  params: t.Dict[str, t.Optional[str]] = {}
+  for f in filters:
+    value = f.value
+    params[_query_parameter_key(f.field, f.filter)] = None if value is None else _get_formatter(type(value))(value)
+  return params
 
 
 class Column:
@@ -64,68 +107,77 @@ class Column:
   A helper class to build #Filter#s.
   """
 
+  __slots__ = ('_name',)
+
   def __init__(self, name: str) -> None:
     self._name = name
 
+  def _filter_name(self) -> str:
+    """
+    Returns the field name that the #Filter#s built from this column refer to. Defaults to the column name.
+    """
+
+    return self._name
+
   def equal(self, value: ValueType) -> Filter:
-    return Filter(self._name, FilterMode.equal, value)
+    return Filter(self._filter_name(), FilterMode.equal, value)
 
   def not_equal(self, value: ValueType) -> Filter:
-    return Filter(self._name, FilterMode.not_equal, value)
+    return Filter(self._filter_name(), FilterMode.not_equal, value)
 
   def filename_contains(self, value: str) -> Filter:
-    return Filter(self._name, FilterMode.filename_contains, value)
+    return Filter(self._filter_name(), FilterMode.filename_contains, value)
 
   def contains(self, value: str) -> Filter:
-    return Filter(self._name, FilterMode.contains, value)
+    return Filter(self._filter_name(), FilterMode.contains, value)
 
   def contains_not(self, value: str) -> Filter:
-    return Filter(self._name, FilterMode.contains_not, value)
+    return Filter(self._filter_name(), FilterMode.contains_not, value)
 
   def higher_than(self, value: Orderable) -> Filter:
-    return Filter(self._name, FilterMode.higher_than, value)
+    return Filter(self._filter_name(), FilterMode.higher_than, value)
 
   def lower_than(self, value: Orderable) -> Filter:
-    return Filter(self._name, FilterMode.lower_than, value)
+    return Filter(self._filter_name(), FilterMode.lower_than, value)
 
   def date_equal(self, value: Date) -> Filter:
-    return Filter(self._name, FilterMode.date_equal, value)
+    return Filter(self._filter_name(), FilterMode.date_equal, value)
 
   def date_before(self, value: Date) -> Filter:
-    return Filter(self._name, FilterMode.date_before, value)
+    return Filter(self._filter_name(), FilterMode.date_before, value)
 
   def date_after(self, value: Date) -> Filter:
-    return Filter(self._name, FilterMode.date_after, value)
+    return Filter(self._filter_name(), FilterMode.date_after, value)
 
   def date_not_equal(self, value: Date) -> Filter:
-    return Filter(self._name, FilterMode.date_not_equal, value)
+    return Filter(self._filter_name(), FilterMode.date_not_equal, value)
 
   def date_equals_today(self) -> Filter:
-    return Filter(self._name, FilterMode.date_equals_today, None)
+    return Filter(self._filter_name(), FilterMode.date_equals_today, None)
 
   def date_equals_month(self, month: int) -> Filter:
-    return Filter(self._name, FilterMode.date_equals_month, month)
+    return Filter(self._filter_name(), FilterMode.date_equals_month, month)
 
   def date_equals_year(self, year: int) -> Filter:
-    return Filter(self._name, FilterMode.date_equals_year, year)
+    return Filter(self._filter_name(), FilterMode.date_equals_year, year)
 
   def single_select_equal(self, value: str) -> Filter:
-    return Filter(self._name, FilterMode.single_select_equal, value)
+    return Filter(self._filter_name(), FilterMode.single_select_equal, value)
 
   def single_select_not_equal(self, value: str) -> Filter:
-    return Filter(self._name, FilterMode.single_select_not_equal, value)
+    return Filter(self._filter_name(), FilterMode.single_select_not_equal, value)
 
   def link_row_has(self, value: int) -> Filter:
-    return Filter(self._name, FilterMode.link_row_has, value)
+    return Filter(self._filter_name(), FilterMode.link_row_has, value)
 
   def link_row_has_not(self, value: int) -> Filter:
-    return Filter(self._name, FilterMode.link_row_has_not, value)
+    return Filter(self._filter_name(), FilterMode.link_row_has_not, value)
 
   # def boolean(self, value: ValueType) -> Filter:
-  #   return Filter(self._name, FilterMode.boolean, value)
+  #   return Filter(self._filter_name(), FilterMode.boolean, value)
 
   def empty(self) -> Filter:
-    return Filter(self._name, FilterMode.empty, None)
+    return Filter(self._filter_name(), FilterMode.empty, None)
 
   def not_empty(self) -> Filter:
-    return Filter(self._name, FilterMode.not_empty, None)
+    return Filter(self._filter_name(), FilterMode.not_empty, None)
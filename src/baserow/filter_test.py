@@ -0,0 +1,31 @@
+
+import datetime
+
+from baserow.filter import Column, Filter, FilterMode, to_query_parameters
+
+
+def test__Filter__to_query_parameter() -> None:
+  """
+  Tests the query parameter key and value formatting for various #Filter values.
+  """
+
+  col = Column('field_1')
+  assert col.equal('foo').to_query_parameter() == ('filter__field_1__equal', 'foo')
+  assert col.higher_than(42).to_query_parameter() == ('filter__field_1__higher_than', '42')
+  assert col.empty().to_query_parameter() == ('filter__field_1__empty', None)
+  assert col.date_equal(datetime.date(2021, 10, 22)).to_query_parameter() == \
+    ('filter__field_1__date_equal', '2021-10-22')
+  assert col.date_before(datetime.datetime(2021, 10, 22, 13, 37)).to_query_parameter() == \
+    ('filter__field_1__date_before', '2021-10-22T13:37:00')
+  assert Filter('field_1', FilterMode.boolean, True).to_query_parameter() == ('filter__field_1__boolean', 'True')
+
+
+def test__to_query_parameters() -> None:
+  filters = [Column('field_1').equal(1), Column('field_2').empty(), Column('field_3').date_after(datetime.date(2021, 1, 2))]
+  assert to_query_parameters(filters) == dict(f.to_query_parameter() for f in filters)
+
+
+def test__FilterMode__str() -> None:
+  assert str(FilterMode.equal) == 'FilterMode.equal'
+  assert f'{FilterMode.not_empty}' == 'FilterMode.not_empty'
+  assert repr(FilterMode.equal) == '<FilterMode.equal: 1>'
@@ -2,11 +2,11 @@
 import argparse
 import getpass
 import importlib
-import json
 import typing as t
 
 from baserow.orm.model import Model
 
+from .. import _json
 from ..client import BaserowClient
 from .mapping import DatabaseMapping, ModelMappingDescription, generate_mapping
 
@@ -52,7 +52,7 @@ def main() -> None:
   if args.write_to:
     mapping.save(args.write_to)
   else:
-    print(json.dumps(mapping.to_json(), indent=2))
+    print(_json.dumps(mapping.to_json(), indent=2).decode('utf-8'))
 
 
 if __name__ == '__main__':
@@ -8,6 +8,7 @@ if t.TYPE_CHECKING:
   from .database import Database
   from .model import Model
 
+T_Column = t.TypeVar('T_Column', bound='Column')
 T_Model = t.TypeVar('T_Model', bound='Model')
 
 
@@ -32,7 +33,7 @@ class Column(_Column):
      column in code.
   2. The user defined name of the column (aka. field) in the Baserow table.
   3. The Baserow internal field ID.
-  4. An ORM internal UUID that is newly generated every for every Column instance. This ID is used as a
+  4. An ORM internal UUID that is generated for every Column instance when it is first needed. This ID is used as a
      placeholder when constructing #Filter#s which the #Query will replace with the Baserow internal
      field ID on execution.
 
@@ -41,6 +42,8 @@ class Column(_Column):
   create a mapping from attribute name to Baserow internal field ID.
   """
 
+  __slots__ = ('_placeholder',)
+
   def __init__(self, user_name: str) -> None:
     """
     # Arguments
@@ -48,9 +51,22 @@ class Column(_Column):
     """
 
     assert isinstance(user_name, str)
-    # We later replace references to this ID in #Filter objects with the actual internal field ID.
-    super().__init__(user_name + '.' + str(uuid.uuid4()))
-    self._user_name = user_name
+    super().__init__(user_name)
+    self._placeholder: t.Optional[str] = None
+
+  if t.TYPE_CHECKING:
+    # NOTE: Columns are not descriptors at runtime. #Model instances store the column values as plain attributes
+    #       and the #Model class returns the #Column (see #_ModelMeta). This tells type checkers the same.
+
+    @t.overload
+    def __get__(self: T_Column, instance: None, owner: t.Any) -> T_Column: ...
+
+    @t.overload
+    def __get__(self, instance: 'Model', owner: t.Any) -> t.Any: ...
+
+    def __get__(self, instance, owner): ...
+
+    def __set__(self, instance: 'Model', value: t.Any) -> None: ...
 
   def __repr__(self) -> str:
     return f'{type(self).__name__}(name={self.name!r})'
@@ -59,6 +75,10 @@ class Column(_Column):
     """
     Convert a value received by Baserow for this column to the value that should be assigned to the
     Model instance attribute.
+
+    This is called for every decoded row, regardless of whether the attribute is ever read. Expensive
+    conversions should return an object that converts on access instead, like the #LinkedRow returned by
+    #ForeignKey. Columns that do not override this method are not called at all when decoding rows.
     """
 
     return value
@@ -77,13 +97,20 @@ class Column(_Column):
 
     return value
 
+  def _filter_name(self) -> str:
+    # We later replace references to this ID in #Filter objects with the actual internal field ID. Most columns
+    # are never used in a filter, so the UUID is only generated on first access.
+    if self._placeholder is None:
+      self._placeholder = self._name + '.' + uuid.uuid4().hex
+    return self._placeholder
+
   @property
   def id(self) -> str:
     """
     The internal ID of the column that is used a as a placeholder when constructing #Filter#s.
     """
 
-    return self._name
+    return self._filter_name()
 
   @property
   def name(self) -> str:
@@ -91,7 +118,7 @@ class Column(_Column):
     The user defined name of the column.
     """
 
-    return self._user_name
+    return self._name
 
 
 class ForeignKey(Column):
@@ -102,13 +129,14 @@ class ForeignKey(Column):
   access.
   """
 
+  __slots__ = ('_model',)
+
   def __init__(self, user_name: str, model: t.Union[t.Type['Model'], t.Callable[[], t.Type['Model']]]) -> None:
     super().__init__(user_name)
     self._model = model
 
   def from_baserow(self, db: 'Database', value: t.Any) -> t.Any:
-    refs = [Ref(x['id'], x['value']) for x in value]
-    return LinkedRow(db, self.model, refs)
+    return LinkedRow._from_raw(db, self.model, value)
 
   def to_baserow(self, value: t.Any) -> t.Any:
     assert isinstance(value, LinkedRow)
@@ -149,35 +177,80 @@ class LinkedRow(t.Sequence[T_Model]):
   Represents a "link row" field. Loads instances of the linked Model on acces.
   """
 
+  __slots__ = ('_db', '_model', '_refs', '_raw', '_cache')
+
   def __init__(
     self,
     db: t.Optional['Database'],
     model: t.Type[T_Model],
-    values: t.List[Ref],
+    values: t.Sequence[Ref],
     cache: t.Optional[t.Dict[int, T_Model]] = None,
   ) -> None:
     self._db = db
     self._model = model
-    self._refs = values
+    self._refs: t.Optional[t.Tuple[Ref, ...]] = tuple(values)
+    #: The link row values as received from Baserow, converted to #_refs on first access.
+    self._raw: t.Optional[t.List[t.Dict[str, t.Any]]] = None
     self._cache: t.Dict[int, T_Model] = cache or {}
 
+  @classmethod
+  def _from_raw(cls, db: 'Database', model: t.Type[T_Model], raw: t.List[t.Dict[str, t.Any]]) -> 'LinkedRow[T_Model]':
+    """
+    Internal. Create a #LinkedRow from the value of a link row field received from Baserow. The #Ref#s are
+    only created when they are accessed.
+    """
+
+    inst: LinkedRow[T_Model] = cls.__new__(cls)
+    inst._db = db
+    inst._model = model
+    inst._refs = None
+    inst._raw = raw
+    inst._cache = {}
+    return inst
+
   def __repr__(self) -> str:
-    return f'{type(self).__name__}({self._refs!r})'
+    return f'{type(self).__name__}({self.refs!r})'
 
   def __len__(self) -> int:
+    if self._refs is None:
+      assert self._raw is not None
+      return len(self._raw)
     return len(self._refs)
 
   def __iter__(self) -> t.Iterator[T_Model]:
-    for i in range(len(self._refs)):
+    for i in range(len(self)):
       yield self[i]
 
   def __getitem__(self, index: int) -> T_Model:  # type: ignore
     if index in self._cache:
       return self._cache[index]
     assert self._db is not None, 'not attached to a database'
-    self._cache[index] = result = self._db._load_single(self._model, self._refs[index].id)
+    self._prefetch_all()
+    if index in self._cache:
+      return self._cache[index]
+    self._cache[index] = result = self._db._load_single(self._model, self.refs[index].id)
     return result
 
+  def _prefetch_all(self) -> None:
+    """
+    Load all linked rows that are not cached yet in one go, instead of one request per accessed index.
+    """
+
+    assert self._db is not None, 'not attached to a database'
+    refs = self.refs
+    missing = [i for i in range(len(refs)) if i not in self._cache]
+    if not missing:
+      return
+    rows = self._db._load_many(self._model, [refs[i].id for i in missing])
+    for i in missing:
+      self._cache[i] = rows[refs[i].id]
+
   @property
-  def refs(self) -> t.List[Ref]:
+  def refs(self) -> t.Tuple[Ref, ...]:
+    if self._refs is None:
+      assert self._raw is not None
+      assert self._db is not None
+      make_ref = self._db._make_ref
+      self._refs = tuple([make_ref(x['id'], x['value']) for x in self._raw])
+      self._raw = None
     return self._refs
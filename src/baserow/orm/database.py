@@ -1,44 +1,41 @@
 
-import copy
+import collections
+import itertools
+import threading
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from ..client import BaserowClient
-from ..filter import Filter, ValueType
+from ..filter import Filter
 from ..types import Page
-from .column import ForeignKey
+from .column import Column, Ref
 from .exc import NoRowReturned
 from .mapping import DatabaseMapping
 from .model import Model
 
 T_Model = t.TypeVar('T_Model', bound='Model')
 
-
-class ColumnPlaceholderTranslator(t.Dict[str, int]):
-  """
-  A helper class that translates #Column.id placeholders to Baserow internal field IDs.
-  """
-
-  def __init__(self, mapping: DatabaseMapping) -> None:
-    self._mapping = mapping
-    self._visited: t.Set[t.Type[Model]] = set()
-
-  def visit(self, model: t.Type[Model]) -> None:
-    """
-    Make the runtime definition of *model* known to the converter. This is needed to ensure that we know the
-    column placeholder IDs and how they are mapped to Baserow internal field IDs.
-    """
-
-    if model not in self._visited:
-      for key, column in model.__columns__.items():
-        self[column.id] = self._mapping.models[model.__id__].fields[key]
-      self._visited.add(model)
+#: The number of rows requested per page if #Query.page_size() is not set. This is the maximum that Baserow allows.
+DEFAULT_PAGE_SIZE = 200
 
 
 class Database:
   """
   ORM for a Baserow database.
+
+  Concurrent requests for the same row through #LinkedRow#s are coalesced. Set #row_cache_size to also keep
+  the rows in a cache, so that rows linked from many other rows are only requested once. The cache is disabled
+  by default, because cached rows do not expire: a row is only removed from the cache when it is saved
+  through the database, or by #clear_cache(). Every #LinkedRow that references a cached row also returns the
+  same model instance, so modifying it is visible through all of them.
   """
 
+  #: The maximum number of rows loaded through #LinkedRow#s to keep in the cache. Zero disables the cache.
+  row_cache_size = 0
+
+  #: The maximum number of #Ref#s that are shared between #LinkedRow#s, see #_make_ref().
+  ref_cache_size = 4096
+
   def __init__(self, client: BaserowClient, mapping: DatabaseMapping) -> None:
     """
     # Arguments
@@ -48,48 +45,152 @@ class Database:
 
     self._client = client
     self._mapping = mapping
-    self._translator = ColumnPlaceholderTranslator(mapping)
+    self._decoders: t.Dict[t.Type[Model], t.Callable[[t.Dict[str, t.Any]], Model]] = {}
+    self._row_cache: 'collections.OrderedDict[t.Tuple[t.Type[Model], int], Model]' = collections.OrderedDict()
+    self._row_requests: t.Dict[t.Tuple[t.Type[Model], int], 'Future[Model]'] = {}
+    self._row_cache_lock = threading.Lock()
+    self._executor: t.Optional[ThreadPoolExecutor] = None
+    self._refs: t.Dict[t.Tuple[int, t.Any, type], Ref] = {}
 
   def __repr__(self) -> str:
     return f'Database(db={self._mapping.database_id})'
 
+  def clear_cache(self) -> None:
+    """
+    Remove all rows from the cache of rows loaded through #LinkedRow#s.
+    """
+
+    with self._row_cache_lock:
+      self._row_cache.clear()
+
+  def _make_ref(self, id: int, name: t.Any) -> Ref:
+    """
+    Internal. Returns a #Ref for a linked row received from Baserow. Rows that are linked from many other rows
+    share the same #Ref instance, as long as it is in the cache of up to #ref_cache_size references.
+    """
+
+    key = (id, name, type(name))
+    try:
+      return self._refs[key]
+    except KeyError:
+      pass
+    except TypeError:  # The name is not hashable.
+      return Ref(id, name)
+    if len(self._refs) >= self.ref_cache_size:
+      self._refs.clear()
+    ref = self._refs[key] = Ref(id, name)
+    return ref
+
   def _load_single(self, model: t.Type[T_Model], row_id: int) -> T_Model:
-    mapping = self._mapping.models[model.__id__]
-    row = self._client.get_database_table_row(mapping.table_id, row_id)
-    return self._build_model_from_row(model, row)
+    key = (model, row_id)
+    with self._row_cache_lock:
+      if key in self._row_cache:
+        self._row_cache.move_to_end(key)
+        return t.cast(T_Model, self._row_cache[key])
+      future = self._row_requests.get(key)
+      if future is None:
+        owned_future: 'Future[Model]' = Future()
+        self._row_requests[key] = owned_future
+
+    # Another thread is already loading the row.
+    if future is not None:
+      return t.cast(T_Model, future.result())
+
+    try:
+      mapping = self._mapping.models[model.__id__]
+      result = self._build_model_from_row(model, self._client.get_database_table_row(mapping.table_id, row_id))
+    except BaseException as exc:
+      with self._row_cache_lock:
+        del self._row_requests[key]
+      owned_future.set_exception(exc)
+      raise
+
+    with self._row_cache_lock:
+      del self._row_requests[key]
+      if self.row_cache_size > 0:
+        self._row_cache[key] = result
+        while len(self._row_cache) > self.row_cache_size:
+          self._row_cache.popitem(last=False)
+    owned_future.set_result(result)
+    return result
+
+  def _load_many(self, model: t.Type[T_Model], row_ids: t.Sequence[int]) -> t.Dict[int, T_Model]:
+    """
+    Load the rows with the given IDs. The Baserow API has no filter for row IDs, so instead of fetching the
+    rows one after the other, they are fetched concurrently over the client's connection pool.
+    """
+
+    unique_ids = list(dict.fromkeys(row_ids))
+    if len(unique_ids) <= 1:
+      return {row_id: self._load_single(model, row_id) for row_id in unique_ids}
+    rows = self._get_executor().map(lambda row_id: self._load_single(model, row_id), unique_ids)
+    return dict(zip(unique_ids, rows))
+
+  def _get_executor(self) -> ThreadPoolExecutor:
+    """
+    Returns the thread pool used by #_load_many(). It is shared by all calls and bounded by the size of the
+    client's connection pool, so that concurrent requests do not wait for a free connection.
+    """
+
+    with self._row_cache_lock:
+      if self._executor is None:
+        self._executor = ThreadPoolExecutor(self._client.pool_maxsize, thread_name_prefix='baserow-orm')
+      return self._executor
 
   def _build_model_from_row(self, model: t.Type[T_Model], row: t.Dict[str, t.Any]) -> T_Model:
-    mapping = self._mapping.models[model.__id__]
-    row.pop('order', None)
-    record_id = row.pop('id')
-    record = {}
-    for key, value in row.items():
-      assert key.startswith('field_')
-      field_id = int(key[6:])
-      if field_id not in mapping.reverse_fields:
-        continue
-      attr_name = mapping.reverse_fields[field_id]
-      column = model.__columns__[attr_name]
-      record[attr_name] = column.from_baserow(self, value)
-    return model(record_id, **record)
+    return self._get_decoder(model)(row)
 
-  def _preprocess_filter(self, filter: Filter) -> Filter:
+  def _get_decoder(self, model: t.Type[T_Model]) -> t.Callable[[t.Dict[str, t.Any]], T_Model]:
     """
-    Internal. Called by the #Query to replace column placeholders with Baserow internal field IDs.
+    Returns a function that converts a row returned by Baserow to an instance of *model*. The mapping of
+    Baserow field names to model attributes and columns is computed only once per model. The function does
+    not modify the row it is given.
     """
 
-    if filter.field in self._translator:
-      filter = copy.copy(filter)
-      filter.field = f'field_{self._translator[filter.field]}'
+    try:
+      return t.cast(t.Callable[[t.Dict[str, t.Any]], T_Model], self._decoders[model])
+    except KeyError:
+      pass
+
+    # Generate a function that assigns every field value directly to the attribute of its column, so that decoding
+    # a row does not allocate an intermediate dictionary. Only columns that convert the value received from
+    # Baserow (e.g. foreign keys) cost a method call.
+    mapping = self._mapping.models[model.__id__]
+    missing = [key for key in model.__columns__ if key not in mapping.field_keys]
+    if missing:
+      raise ValueError(f'columns of model {model.__id__!r} are not in the database mapping: {", ".join(missing)}')
+    namespace: t.Dict[str, t.Any] = {'__model': model, '__new': model.__new__, '__db': self}
+    lines = ['def decoder(row):', '  inst = __new(__model)', "  inst.id = row['id']"]
+    for index, (attr_name, field_key) in enumerate(mapping.field_keys.items()):
+      column = model.__columns__[attr_name]
+      value = f'row[{field_key!r}]'
+      if type(column).from_baserow is not Column.from_baserow:
+        namespace[f'__from_baserow_{index}'] = column.from_baserow
+        value = f'__from_baserow_{index}(__db, {value})'
+      lines.append(f'  inst.{attr_name} = {value}')
+    lines.append('  return inst')
+
+    exec('\n'.join(lines), namespace)
+    decoder = namespace['decoder']
+    self._decoders[model] = decoder
+    return decoder
+
+  def _preprocess_filter(self, model: t.Type[Model], filter: Filter) -> Filter:
+    """
+    Internal. Called by the #Query to replace column placeholders of *model* with Baserow internal field IDs.
+    Returns a new #Filter, the *filter* is not modified and can be reused.
+    """
 
-    return filter
+    field = self._mapping.models[model.__id__].placeholder_fields(model).get(filter.field)
+    if field is None:
+      return filter
+    return Filter(field, filter.filter, filter.value)
 
   def select(self, model: t.Type[T_Model]) -> 'Query[T_Model]':
     """
     Create a new #Query for rows of the given model.
     """
 
-    self._translator.visit(model)
     return Query(self, model)
 
   def save(self, row: Model) -> None:
@@ -101,18 +202,23 @@ class Database:
     mapping = self._mapping.models[row.__id__]
     record: t.Dict[str, t.Any] = {}
     for key, col in row.__columns__.items():
-      record[f'field_{mapping.fields[key]}'] = col.to_baserow(getattr(row, key))
+      record[mapping.field_keys[key]] = col.to_baserow(getattr(row, key))
 
     if row.id is None:
       row.id = self._client.create_database_table_row(mapping.table_id, record)['id']
     else:
       self._client.update_database_table_row(mapping.table_id, row.id, record)
+      with self._row_cache_lock:
+        self._row_cache.pop((type(row), row.id), None)
 
 
 class Query(t.Generic[T_Model]):
   """
   Represents a query for the rows of a particular model. A query can be modified until it is executed,
   after which it becomes immutable. Iterating over a query yields all matching rows as model instances.
+
+  While the rows of a page are consumed, the next page is already requested from a background thread.
+  Each executed query owns one such thread until its last page was fetched.
   """
 
   def __init__(self, db: Database, model: t.Type[T_Model]) -> None:
@@ -121,32 +227,48 @@ class Query(t.Generic[T_Model]):
     self._mapping = db._mapping.models[model.__id__]
     self._filters: t.List[Filter] = []
     self._page_size: t.Optional[int] = None
-    self._paginator: t.Optional[t.Iterator[Page[t.Dict[str, str]]]] = None
-    self._page_items: t.Optional[t.Iterator[t.Dict[str, str]]] = None
+    self._rows: t.Optional[t.Iterator[T_Model]] = None
+    self._decoder = db._get_decoder(model)
+    self._prefetch = True
 
   def __iter__(self) -> 'Query':
     return self
 
   def __next__(self) -> T_Model:
-    if not self._paginator:
+    if self._rows is None:
       self._begin()
-      assert self._paginator is not None
-    while True:
-      if self._page_items is None:
-        self._page_items = iter(next(self._paginator).results)
-      try:
-        row = next(self._page_items)
-        break
-      except StopIteration:
-        self._page_items = None
-        continue
-
-    return self._db._build_model_from_row(self._model, row)
+      assert self._rows is not None
+    return next(self._rows)
 
   def _begin(self) -> None:
-    self._paginator = self._db._client.paginated_database_table_rows(
+    paginator = self._db._client.paginated_database_table_rows(
       self._mapping.table_id,
-      filter=self._filters)
+      filter=self._filters,
+      size=self._page_size or DEFAULT_PAGE_SIZE)
+    # NOTE: The generators do not reference the query, so an abandoned query is freed (and its prefetching
+    #       thread stopped) without waiting for the garbage collector.
+    pages = self._iter_prefetched(paginator) if self._prefetch else paginator
+    self._rows = map(self._decoder, itertools.chain.from_iterable(page.results for page in pages))
+
+  @staticmethod
+  def _iter_prefetched(paginator: t.Iterator[Page[t.Dict[str, t.Any]]]) -> t.Iterator[Page[t.Dict[str, t.Any]]]:
+    """
+    Yields the pages from *paginator*, requesting the next page from a background thread while the current
+    page is consumed. At most one page is fetched ahead, which bounds the memory used for prefetching.
+    """
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(next, paginator, None)
+    try:
+      while True:
+        page = future.result()
+        if page is None:
+          return
+        future = executor.submit(next, paginator, None)
+        yield page
+    finally:
+      future.cancel()
+      executor.shutdown(wait=False)
 
   @property
   def executed(self) -> bool:
@@ -154,7 +276,7 @@ class Query(t.Generic[T_Model]):
     Returns #True if the query has been executed.
     """
 
-    return self._paginator is not None
+    return self._rows is not None
 
   def filter(self, *filters: Filter) -> 'Query[T_Model]':
     """
@@ -164,12 +286,15 @@ class Query(t.Generic[T_Model]):
     if self.executed:
       raise RuntimeError('Query has already been executed')
     for filter in filters:
-      self._filters.append(self._db._preprocess_filter(filter))
+      self._filters.append(self._db._preprocess_filter(self._model, filter))
     return self
 
   def page_size(self, page_size: int) -> 'Query[T_Model]':
     """
     Set the number of rows to return per call to the Baserow API. This method modified the query.
+
+    Larger pages need fewer round trips to scan a table, at the cost of holding more rows in memory at a time.
+    Defaults to #DEFAULT_PAGE_SIZE.
     """
 
     if self.executed:
@@ -188,6 +313,7 @@ class Query(t.Generic[T_Model]):
       raise RuntimeError('Query has already been executed')
 
     self.page_size(1)
+    self._prefetch = False
     try:
       return next(self)
     except StopIteration:
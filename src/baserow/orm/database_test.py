@@ -0,0 +1,195 @@
+
+import threading
+import time
+import typing as t
+
+import pytest
+
+from baserow.orm import Column, Database, DatabaseMapping, Model
+from baserow.orm.column import LinkedRow, Ref
+from baserow.orm.database import DEFAULT_PAGE_SIZE
+from baserow.orm.mapping import ModelMapping
+from baserow.types import Page
+
+
+class Product(Model):
+  name = Column('Name')
+  price = Column('Price')
+
+
+class FakeClient:
+  """
+  Serves the rows of a single table and records the arguments of every paginated request and the IDs of
+  every row that is requested individually. Updates are not stored.
+  """
+
+  pool_maxsize = 4
+
+  def __init__(self, rows: t.List[t.Dict[str, t.Any]]) -> None:
+    self.rows = rows
+    self.calls: t.List[t.Dict[str, t.Any]] = []
+    self.row_calls: t.List[int] = []
+
+  def paginated_database_table_rows(self, table_id: int, **kwargs: t.Any) -> t.Iterator[Page[t.Dict[str, t.Any]]]:
+    self.calls.append({'table_id': table_id, **kwargs})
+    size = kwargs['size']
+    for i in range(0, len(self.rows), size):
+      yield Page(len(self.rows), None, None, self.rows[i:i + size])
+
+  def get_database_table_row(self, table_id: int, row_id: int) -> t.Dict[str, t.Any]:
+    self.row_calls.append(row_id)
+    for row in self.rows:
+      if row['id'] == row_id:
+        return row
+    raise KeyError(row_id)
+
+  def update_database_table_row(self, table_id: int, row_id: int, record: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+    return {'id': row_id, **record}
+
+
+def make_database(num_rows: int) -> t.Tuple[FakeClient, Database]:
+  rows = [{'id': i, 'order': str(i), 'field_1': f'p{i}', 'field_2': i * 10} for i in range(1, num_rows + 1)]
+  client = FakeClient(rows)
+  mapping = DatabaseMapping(1, {Product.__id__: ModelMapping(10, {'name': 1, 'price': 2})})
+  return client, Database(client, mapping)  # type: ignore[arg-type]
+
+
+def test__Query__first__requests_a_single_row() -> None:
+  client, db = make_database(3)
+  product = db.select(Product).filter(Product.name.equal('p1')).first()
+  assert product.as_dict() == {'id': 1, 'name': 'p1', 'price': 10}
+  assert len(client.calls) == 1
+  assert client.calls[0]['size'] == 1
+  assert [f.to_query_parameter() for f in client.calls[0]['filter']] == [('filter__field_1__equal', 'p1')]
+
+
+def test__Query__iterates_all_pages() -> None:
+  client, db = make_database(5)
+  assert [p.id for p in db.select(Product).page_size(2)] == [1, 2, 3, 4, 5]
+  assert client.calls[0]['size'] == 2
+  list(db.select(Product))
+  assert client.calls[1]['size'] == DEFAULT_PAGE_SIZE
+
+
+def test__Database__decodes_rows_with_the_cached_field_table() -> None:
+  client, db = make_database(1)
+  row = dict(client.rows[0], field_99='unmapped')
+  product = db._build_model_from_row(Product, row)
+  assert product.as_dict() == {'id': 1, 'name': 'p1', 'price': 10}
+  assert row == dict(client.rows[0], field_99='unmapped')
+  assert db._get_decoder(Product) is db._get_decoder(Product)
+
+
+def test__Database__decoder_requires_every_column_in_the_mapping() -> None:
+  client = FakeClient([])
+  mapping = DatabaseMapping(1, {Product.__id__: ModelMapping(10, {'name': 1})})
+  db = Database(client, mapping)  # type: ignore[arg-type]
+  with pytest.raises(ValueError, match='price'):
+    db._get_decoder(Product)
+
+
+def test__Database__load_many__requests_every_row_once() -> None:
+  client, db = make_database(3)
+  rows = db._load_many(Product, [2, 1, 2, 3, 1])
+  assert {k: v.as_dict() for k, v in rows.items()} == {
+    1: {'id': 1, 'name': 'p1', 'price': 10},
+    2: {'id': 2, 'name': 'p2', 'price': 20},
+    3: {'id': 3, 'name': 'p3', 'price': 30},
+  }
+  assert sorted(client.row_calls) == [1, 2, 3]
+
+
+def test__LinkedRow__prefetches_the_rows_that_are_not_loaded() -> None:
+  client, db = make_database(4)
+  linked = LinkedRow._from_raw(db, Product, [{'id': i, 'value': f'p{i}'} for i in (1, 2, 4)])
+  loaded = Product(2, name='p2', price=20)
+  linked._cache[1] = loaded
+  assert linked[2].as_dict() == {'id': 4, 'name': 'p4', 'price': 40}
+  assert sorted(client.row_calls) == [1, 4]
+  assert [p.id for p in linked] == [1, 2, 4]
+  assert linked[1] is loaded
+  assert sorted(client.row_calls) == [1, 4]
+
+
+def test__LinkedRow__refs_are_shared() -> None:
+  _, db = make_database(0)
+  db.ref_cache_size = 2
+  raw = [{'id': 2, 'value': 'b'}, {'id': 1, 'value': 'a'}]
+  first, second = (LinkedRow._from_raw(db, Product, list(raw)).refs for _ in range(2))
+  assert first == second == (Ref(2, 'b'), Ref(1, 'a'))
+  assert all(x is y for x, y in zip(first, second))
+  assert sorted(first) == [(1, 'a'), (2, 'b')]
+  assert first[0]._replace(name='c') == Ref(2, 'c')
+
+  # Adding a reference to the full cache starts over.
+  third = LinkedRow._from_raw(db, Product, [{'id': 3, 'value': 'c'}, *raw]).refs
+  assert third[1] == first[0] and third[1] is not first[0]
+  assert len(db._refs) <= db.ref_cache_size
+
+
+def test__Database__row_cache() -> None:
+  client, db = make_database(3)
+  assert db._load_single(Product, 1) is not db._load_single(Product, 1)
+  assert client.row_calls == [1, 1]
+
+  client.row_calls.clear()
+  db.row_cache_size = 2
+  assert db._load_single(Product, 1) is db._load_single(Product, 1)
+  for row_id in (2, 1, 3, 2, 3):
+    db._load_single(Product, row_id)
+  # Loading row 3 evicts row 2, which was used less recently than row 1.
+  assert client.row_calls == [1, 2, 3, 2]
+
+  db.save(db._load_single(Product, 3))
+  db._load_single(Product, 3)
+  db.clear_cache()
+  db._load_single(Product, 2)
+  assert client.row_calls == [1, 2, 3, 2, 3, 2]
+
+
+def test__Database__row_cache__is_separate_for_subclasses() -> None:
+  class SpecialProduct(Product):
+    pass
+
+  client, db = make_database(1)
+  db.row_cache_size = 2
+  assert type(db._load_single(Product, 1)) is Product
+  assert type(db._load_single(SpecialProduct, 1)) is SpecialProduct
+  assert type(db._load_single(Product, 1)) is Product
+  assert client.row_calls == [1, 1]
+
+
+def test__Database__coalesces_concurrent_row_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+  client, db = make_database(1)
+  requested, release = threading.Event(), threading.Event()
+  get_row = client.get_database_table_row
+
+  def blocking_get_row(table_id: int, row_id: int) -> t.Dict[str, t.Any]:
+    requested.set()
+    release.wait(5)
+    return get_row(table_id, row_id)
+
+  monkeypatch.setattr(client, 'get_database_table_row', blocking_get_row)
+  results: t.List[Product] = []
+  threads = [threading.Thread(target=lambda: results.append(db._load_single(Product, 1))) for _ in range(3)]
+  threads[0].start()
+  assert requested.wait(5)
+  for thread in threads[1:]:
+    thread.start()
+  time.sleep(0.1)  # Give the other threads time to wait for the pending request.
+  release.set()
+  for thread in threads:
+    thread.join()
+  assert client.row_calls == [1]
+  assert len(results) == 3 and results[0] is results[1] is results[2]
+  assert db._row_requests == {}
+
+
+def test__Database__load_single__does_not_keep_failed_requests() -> None:
+  client, db = make_database(1)
+  with pytest.raises(KeyError):
+    db._load_single(Product, 2)
+  assert db._row_requests == {}
+  with pytest.raises(KeyError):
+    db._load_single(Product, 2)
+  assert client.row_calls == [2, 2]
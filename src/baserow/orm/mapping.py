@@ -1,11 +1,10 @@
 
 import dataclasses
-import json
+import types
 import typing as t
 from pathlib import Path
 
-import databind.json
-
+from .. import _json
 from ..client import BaserowClient
 from .model import Model, ModelMappingDescription
 
@@ -16,20 +15,42 @@ class ModelMapping:
   Contains the mapping details for a model.
   """
 
+  __slots__ = ('table_id', 'fields', 'reverse_fields', 'field_keys', '_placeholders')
+
   #: The table ID in Baserow.
   table_id: int
 
-  #: Maps model attribute names defined to internal field IDs.
+  #: Maps model attribute names defined to internal field IDs. Treat this as immutable after construction,
+  #: or call #invalidate() after modifying it.
   fields: t.Dict[str, int]
 
   def __post_init__(self) -> None:
-    self._reverse_fields: t.Optional[t.Dict[int, str]] = {}
+    self.invalidate()
+
+  def invalidate(self) -> None:
+    """
+    Recompute the data derived from #fields.
+    """
 
-  @property
-  def reverse_fields(self) -> t.Dict[int, str]:
-    if self._reverse_fields is None or len(self.fields) != len(self._reverse_fields):
-      self._reverse_fields = {v: k for k, v in self.fields.items()}
-    return self._reverse_fields
+    #: Maps internal field IDs to model attribute names. This is a read-only view.
+    self.reverse_fields: t.Mapping[int, str] = types.MappingProxyType({v: k for k, v in self.fields.items()})
+    #: Maps model attribute names to the Baserow internal field names (`field_<id>`). This is a read-only view.
+    self.field_keys: t.Mapping[str, str] = types.MappingProxyType({k: f'field_{v}' for k, v in self.fields.items()})
+    self._placeholders: t.Dict[t.Type[Model], t.Dict[str, str]] = {}
+
+  def placeholder_fields(self, model: t.Type[Model]) -> t.Dict[str, str]:
+    """
+    Returns a mapping of the column placeholder IDs of *model* (see #Column.id) to the Baserow internal field
+    names (`field_<id>`). It is computed from the runtime definition of *model* on the first call.
+    """
+
+    try:
+      return self._placeholders[model]
+    except KeyError:
+      pass
+    placeholders = {column.id: self.field_keys[key] for key, column in model.__columns__.items()}
+    self._placeholders[model] = placeholders
+    return placeholders
 
 
 @dataclasses.dataclass
@@ -38,25 +59,33 @@ class DatabaseMapping:
   Contains the mapping details for a database and its models.
   """
 
+  __slots__ = ('database_id', 'models')
+
   #: The database ID in Baserow.
   database_id: int
 
   #: The models included in this database mapping.
   models: t.Dict[str, ModelMapping]
 
+  # NOTE: The structure of the mapping is fixed, so it is converted by hand instead of with databind.
+
   def to_json(self) -> t.Dict[str, t.Any]:
-    return databind.json.dump(self)  # type: ignore
+    return {
+      'database_id': self.database_id,
+      'models': {k: {'table_id': v.table_id, 'fields': v.fields} for k, v in self.models.items()},
+    }
 
   @staticmethod
   def from_json(data: t.Dict[str, t.Any]) -> 'DatabaseMapping':
-    return databind.json.load(data, DatabaseMapping)
+    models = {k: ModelMapping(v['table_id'], v['fields']) for k, v in data['models'].items()}
+    return DatabaseMapping(data['database_id'], models)
 
   def save(self, filename: t.Union[str, Path], indent: t.Optional[int] = None) -> None:
-    Path(filename).write_text(json.dumps(self.to_json(), indent=indent))
+    Path(filename).write_bytes(_json.dumps(self.to_json(), indent=indent))
 
   @staticmethod
   def load(filename: t.Union[str, Path]) -> 'DatabaseMapping':
-    return databind.json.loads(Path(filename).read_text(), DatabaseMapping)
+    return DatabaseMapping.from_json(_json.loads(Path(filename).read_bytes()))
 
 
 def generate_mapping(
@@ -89,6 +118,8 @@ def generate_mapping(
   except StopIteration:
     raise ValueError(f'database {dbname!r} does not exist')
 
+  # Reversed, so that the first table wins if there are multiple with the same name.
+  tables = {table.name: table for table in reversed(db.tables)}
   model_mappings: t.Dict[str, ModelMapping] = {}
 
   for model in models:
@@ -97,18 +128,16 @@ def generate_mapping(
       if not model.__tablename__:
         raise ValueError(f'Missing __tablename__ for model {model.__id__!r}')
       model = ModelMappingDescription(model.__id__, model.__columns__, model.__tablename__, {})
-    try:
-      table = next(t for t in db.tables if t.name == model.table_name)
-    except StopIteration:
+    table = tables.get(model.table_name)
+    if table is None:
       raise ValueError(f'table {dbname!r}/{model.table_name!r} does not exist')
 
-    table_fields = {f.name: f for f in client.list_database_table_fields(table.id)}
-    fields: t.Dict[str, int] = {}
-    for key, column in model.columns.items():
-      name = model.field_name_overrides.get(key) or column.name
-      if name not in table_fields:
-        raise ValueError(f'field {dbname!r}/{model.table_name!r}/{name} does not exist')
-      fields[key] = table_fields[name].id
+    name_to_id = {f.name: f.id for f in client.list_database_table_fields(table.id)}
+    names = {key: model.field_name_overrides.get(key) or column.name for key, column in model.columns.items()}
+    missing = [name for name in names.values() if name not in name_to_id]
+    if missing:
+      raise ValueError(f'fields in {dbname!r}/{model.table_name!r} do not exist: {", ".join(missing)}')
+    fields = {key: name_to_id[name] for key, name in names.items()}
 
     model_mappings[model.model_id] = ModelMapping(table.id, fields)
 
@@ -1,44 +1,83 @@
 
-import copy
 import dataclasses
 import typing as t
 
 from .column import Column
 
 
-class Model:
+class _ModelMeta(type):
+  """
+  Collects the #Column#s declared in the class body of a #Model, and those inherited from its #Model bases,
+  into `__columns__`. The columns are removed from the class namespace, so that model instances store the
+  column values as plain attributes and reading them does not go through a descriptor. Accessing a column on
+  the class itself (e.g. `Product.name.equal(...)`) still returns the #Column.
+
+  If the class body declares `__slots__`, a slot is added for every column that the class declares.
+  """
+
+  def __new__(mcs, name: str, bases: t.Tuple[type, ...], namespace: t.Dict[str, t.Any], **kwargs: t.Any) -> '_ModelMeta':
+    columns = {key: value for key, value in namespace.items() if isinstance(value, Column)}
+    for key in columns:
+      del namespace[key]
+
+    # Inherit the columns of all model bases, an earlier definition wins. Columns are not modified after their
+    # creation, so subclasses share the column objects with their parent classes.
+    inherited: t.Dict[str, Column] = {}
+    for base in bases:
+      if isinstance(base, _ModelMeta):
+        for key, value in base.__columns__.items():
+          inherited.setdefault(key, value)
+
+    if '__slots__' in namespace:
+      slots = namespace['__slots__']
+      if isinstance(slots, str):
+        slots = (slots,)
+      namespace['__slots__'] = tuple(slots) + tuple(key for key in columns if key not in inherited)
+
+    namespace['__columns__'] = {**columns, **{k: v for k, v in inherited.items() if k not in columns}}
+    return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+  def __getattribute__(cls, name: str) -> t.Any:
+    columns = type.__getattribute__(cls, '__columns__')
+    if name in columns:
+      return columns[name]
+    return type.__getattribute__(cls, name)
+
+
+class Model(metaclass=_ModelMeta):
   """
   Base class to represent a Baserow table. Static class members on the base class that are instances of the
   #Column class are recognized as fields that are associated with fields in a Baserow database table.
+
+  Declare `__slots__` (e.g. `__slots__ = ()`) on a model class to store its column values in slots instead of
+  the instance `__dict__`. This saves memory when many rows are loaded, but like for any class with slots,
+  instances can then not have other attributes, and a class can not inherit from more than one model class
+  with slots.
   """
 
+  __slots__ = ('id', '__weakref__')
+
   id: t.Optional[int]
   __id__: t.ClassVar[str]
   __tablename__: t.ClassVar[t.Optional[str]]
   __columns__: t.ClassVar[t.Dict[str, Column]]
 
   def __init_subclass__(cls) -> None:
-    cls.__columns__ = {}
     if '__tablename__' not in vars(cls):
       cls.__tablename__ = None
 
     if not hasattr(cls, '__id__'):
       cls.__id__ = cls.__module__ + '.' + cls.__name__
 
-    for key, value in vars(cls).items():
-      if isinstance(value, Column):
-        cls.__columns__[key] = value
-
-    # Inherit parent class columns.
-    for base in cls.__bases__:
-      if issubclass(base, Model):
-        for key, value in base.__columns__.items():
-          if key not in cls.__columns__:
-            cls.__columns__[key] = copy.copy(value)
-
     if 'id' in cls.__columns__:
       raise ValueError(f'attribute name "id" is reserved')
 
+    # Replace the generic constructor, but not one that is defined by the user.
+    if cls.__init__ is Model.__init__ or getattr(cls.__init__, '__generated__', False):
+      init = _generate_init(cls)
+      if init is not None:
+        setattr(cls, '__init__', init)
+
   def __init__(self, id: t.Optional[int] = None, **kwargs) -> None:
     self.id = id
     for key, col in self.__columns__.items():
@@ -61,11 +100,47 @@ class Model:
     return ModelMappingDescription(cls.__id__, cls.__columns__, table_name, field_name_overrides or {})
 
 
-Model.__columns__ = {}
+def _generate_init(cls: t.Type[Model]) -> t.Optional[t.Callable[..., None]]:
+  """
+  Internal. Generates a constructor for *cls* that accepts every column as a keyword-only argument and
+  stores it in its slot, without the dictionary scans of the generic #Model.__init__(). Returns #None
+  if a column name can not be used as an argument name.
+
+  The constructor is inherited by subclasses that define their own `__init__()`, which may pass additional
+  columns to it through `super().__init__()`. It delegates to the generic #Model.__init__() for instances
+  of such subclasses, and to report unrecognized arguments.
+  """
+
+  if 'self' in cls.__columns__:
+    return None
+
+  args = ''.join(f'{key}, ' for key in cls.__columns__)
+  kwargs = ''.join(f'{key}={key}, ' for key in cls.__columns__)
+  lines = [
+    f'def __init__(self, id=None, {"*, " if args else ""}{args}**__kwargs):',
+    '  if __kwargs or type(self) is not __cls:',
+    f'    return __init(self, id, {kwargs}**__kwargs)',
+    '  self.id = id',
+  ]
+  namespace: t.Dict[str, t.Any] = {'__cls': cls, '__init': Model.__init__}
+  for index, (key, column) in enumerate(cls.__columns__.items()):
+    if type(column).from_python is Column.from_python:
+      lines.append(f'  self.{key} = {key}')
+    else:
+      namespace[f'__from_python_{index}'] = column.from_python
+      lines.append(f'  self.{key} = __from_python_{index}({key})')
+
+  exec('\n'.join(lines), namespace)
+  init = namespace['__init__']
+  init.__qualname__ = f'{cls.__qualname__}.__init__'
+  init.__generated__ = True
+  return t.cast(t.Callable[..., None], init)
 
 
 @dataclasses.dataclass
 class ModelMappingDescription:
+  __slots__ = ('model_id', 'columns', 'table_name', 'field_name_overrides')
+
   model_id: str
   columns: t.Dict[str, Column]
   table_name: str
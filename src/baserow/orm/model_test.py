@@ -0,0 +1,104 @@
+
+import pickle
+import typing as t
+
+import pytest
+
+from baserow.filter import Filter, FilterMode
+from baserow.orm import Column, Model
+
+
+class Product(Model):
+  name = Column('Name')
+  price = Column('Price')
+
+
+class DiscountedProduct(Product):
+  __slots__ = ()
+  discount = Column('Discount')
+
+
+class SlottedProduct(Model):
+  __slots__ = ()
+  name = Column('Name')
+  price = Column('Price')
+
+
+class SlottedDiscountedProduct(SlottedProduct):
+  __slots__ = ()
+  discount = Column('Discount')
+
+
+class Tagged(Model):
+  tags = Column('Tags')
+
+
+class TaggedProduct(Product, Tagged):
+  pass
+
+
+def test__Model__stores_values_in_attributes() -> None:
+  product = DiscountedProduct(1, name='foo', price=10, discount=2)
+  assert vars(product) == {'name': 'foo', 'price': 10}
+  assert product.as_dict() == {'id': 1, 'discount': 2, 'name': 'foo', 'price': 10}
+  assert isinstance(DiscountedProduct.name, Column)
+  assert DiscountedProduct.name is Product.name
+  assert DiscountedProduct.__columns__ == {'discount': DiscountedProduct.discount, 'name': Product.name, 'price': Product.price}
+  assert pickle.loads(pickle.dumps(product)).as_dict() == product.as_dict()
+
+
+def test__Model__stores_values_in_slots() -> None:
+  product = SlottedDiscountedProduct(1, name='foo', price=10, discount=2)
+  assert not hasattr(product, '__dict__')
+  assert product.as_dict() == {'id': 1, 'discount': 2, 'name': 'foo', 'price': 10}
+  assert isinstance(SlottedDiscountedProduct.name, Column)
+  assert pickle.loads(pickle.dumps(product)).as_dict() == product.as_dict()
+  with pytest.raises(AttributeError):
+    product.foo = 42  # type: ignore[attr-defined]
+  with pytest.raises(AttributeError, match='discount'):
+    SlottedDiscountedProduct.__new__(SlottedDiscountedProduct).discount
+
+
+def test__Model__inherits_columns_from_multiple_models() -> None:
+  assert list(TaggedProduct.__columns__) == ['name', 'price', 'tags']
+  assert TaggedProduct(1, name='foo', price=10, tags=[]).as_dict() == {'id': 1, 'name': 'foo', 'price': 10, 'tags': []}
+
+
+def test__Model__generated_constructor_checks_arguments() -> None:
+  with pytest.raises(TypeError):
+    Product(name='foo')
+  with pytest.raises(TypeError):
+    Product(name='foo', price=10, discount=2)
+
+
+def test__Model__generated_constructor_is_inherited_by_custom_constructors() -> None:
+  class Child(Product):
+    extra = Column('Extra')
+
+    def __init__(self, id: t.Optional[int] = None, **kwargs: t.Any) -> None:
+      kwargs.setdefault('extra', 'default')
+      super().__init__(id, **kwargs)
+
+  assert Child(1, name='foo', price=10).as_dict() == {'id': 1, 'name': 'foo', 'price': 10, 'extra': 'default'}
+  with pytest.raises(TypeError):
+    Child(name='foo', price=10, discount=2)
+  with pytest.raises(TypeError):
+    Child(name='foo')
+
+
+def test__Model__custom_constructor_can_set_other_attributes() -> None:
+  class CachedProduct(Product):
+    def __init__(self, id: t.Optional[int] = None, **kwargs: t.Any) -> None:
+      super().__init__(id, **kwargs)
+      self.cache: t.Dict[str, t.Any] = {}
+
+  product = CachedProduct(name='foo', price=10)
+  assert product.cache == {}
+  assert product.as_dict() == {'id': None, 'name': 'foo', 'price': 10}
+
+
+def test__Column__filters_refer_to_placeholder_id() -> None:
+  column = Column('Name')
+  assert column.name == 'Name'
+  assert column.id.startswith('Name.') and column.id == column.id
+  assert column.equal('foo') == Filter(column.id, FilterMode.equal, 'foo')
@@ -3,7 +3,9 @@ import dataclasses
 import enum
 import typing as t
 
-from databind.core.settings import Union
+from databind.core.settings import ExtraKeys, Union
+
+from ._compat import DATACLASS_SLOTS
 
 T = t.TypeVar('T')
 
@@ -13,6 +15,7 @@ class Permissions(enum.Enum):
   ADMIN = enum.auto()
 
 
+@ExtraKeys()
 @dataclasses.dataclass
 class User:
   id: int
@@ -22,11 +25,13 @@ class User:
   language: str
 
 
+@ExtraKeys()
 @dataclasses.dataclass
 class Group:
   id: int
   name: str
 
+@ExtraKeys()
 @dataclasses.dataclass
 class Workspace:
   id: int
@@ -42,6 +47,7 @@ class PermissionedOrderedGroup(OrderedGroup):
   permissions: Permissions
 
 
+@ExtraKeys()
 @dataclasses.dataclass
 class Table:
   id: int
@@ -51,7 +57,7 @@ class Table:
 
 
 @Union(style=Union.FLAT)
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class TableField:
   id: int
   table_id: int
@@ -60,6 +66,7 @@ class TableField:
   primary: bool
 
 
+@ExtraKeys()
 @dataclasses.dataclass
 class Application:
   id: int